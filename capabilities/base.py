@@ -6,12 +6,18 @@ Each capability is self-contained and handles its own business logic.
 """
 
 from abc import ABC, abstractmethod
+from functools import cached_property
 from typing import Dict, List, Any
 from pydantic import BaseModel
 
 from models.capabilities import CapabilityInputs, CapabilityResult
 
 
+def truncate(text: str, limit: int) -> str:
+    """Cut text to limit characters, adding an ellipsis only when something was cut"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
 class CapabilityDescription(BaseModel):
     """Description of a capability for LLM understanding"""
     name: str
@@ -34,6 +40,11 @@ class BaseCapability(ABC):
         """Execute capability with typed inputs/outputs"""
         pass
     
+    @cached_property
+    def description(self) -> CapabilityDescription:
+        """Memoized describe() - descriptions are static per capability instance"""
+        return self.describe()
+    
     def get_name(self) -> str:
         """Get capability name"""
-        return self.describe().name
\ No newline at end of file
+        return self.description.name
\ No newline at end of file
@@ -8,18 +8,37 @@ Uses Claude Sonnet for more nuanced, contextual responses.
 """
 
 import os
+import re
 import httpx
 import json
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
-from capabilities.base import BaseCapability, CapabilityDescription
+from capabilities.base import BaseCapability, CapabilityDescription, truncate
+from services.http_client import SharedClient
 from models.capabilities import (
     ChatInputs, ChatResult, EmotionalContext, UserContext, 
     CapabilityInputs, CapabilityResult
 )
 
 
+# Pulls the JSON object out of the model's reply
+JSON_OBJECT_PATTERN = re.compile(r'\{.*\}', re.DOTALL)
+
+# Chat turns reuse pooled connections to the LLM provider across requests
+_CLIENT = SharedClient()
+
+
+def get_client() -> httpx.AsyncClient:
+    """Shared chat HTTP client, reopened if it was closed"""
+    return _CLIENT.get()
+
+
+async def close_client():
+    """Close the shared chat HTTP client (call on application shutdown)"""
+    await _CLIENT.close()
+
+
 class ChatCapability(BaseCapability):
     """AI companion for emotional support and conversation"""
     
@@ -112,10 +131,11 @@ Provide brief, warm support first. Keep responses concise but caring.
         history_context = ""
         if inputs.conversation_history:
             recent_messages = inputs.conversation_history[-3:]  # Last 3 messages
-            history_context = "Recent conversation:\n"
+            history_lines = ["Recent conversation:\n"]
             for msg in recent_messages:
                 role = "User" if msg.role == "user" else "Assistant"
-                history_context += f"{role}: {msg.content[:100]}...\n"
+                history_lines.append(f"{role}: {truncate(msg.content, 100)}\n")
+            history_context = "".join(history_lines)
         
         # Check if 10+ messages - suggest preferences update
         suggest_preferences = len(inputs.conversation_history) >= 10 and len(inputs.conversation_history) % 10 == 0
@@ -161,96 +181,99 @@ Match the user's emotional level - don't be overly supportive for neutral questi
     async def _generate_response(self, prompt: str, inputs: ChatInputs) -> Dict[str, Any]:
         """Generate response using Claude or OpenAI"""
         
+        # Session header lets a session-aware proxy keep every turn on one
+        # backend, so the growing conversation prefix stays cached
+        session_headers = {"X-Session-ID": inputs.session_id} if inputs.session_id else {}
+        
         if self.use_anthropic:
-            return await self._generate_claude_response(prompt)
+            return await self._generate_claude_response(prompt, session_headers)
         else:
-            return await self._generate_openai_response(prompt)
+            return await self._generate_openai_response(prompt, session_headers)
     
-    async def _generate_claude_response(self, prompt: str) -> Dict[str, Any]:
+    async def _generate_claude_response(self, prompt: str, extra_headers: Dict[str, str] = None) -> Dict[str, Any]:
         """Generate response using Claude API"""
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                self.api_url,
-                headers={
-                    "x-api-key": self.api_key,
-                    "anthropic-version": "2023-06-01",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": self.model,
-                    "max_tokens": 400,
-                    "temperature": 0.7,
-                    "messages": [
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ]
-                }
-            )
-            response.raise_for_status()
-            
-            result = response.json()
-            content = result["content"][0]["text"]
-            
-            try:
-                # Extract JSON from response
-                import re
-                json_match = re.search(r'\{.*\}', content, re.DOTALL)
-                if json_match:
-                    return json.loads(json_match.group())
-                else:
-                    raise ValueError("No JSON found in response")
-            except (json.JSONDecodeError, ValueError):
-                # Fallback
-                return {
-                    "response": content[:200],  # Limit length
-                    "follow_up_questions": [],
-                    "emotional_tone": "conversational",
-                    "support_provided": False
-                }
+        response = await get_client().post(
+            self.api_url,
+            headers={
+                "x-api-key": self.api_key,
+                "anthropic-version": "2023-06-01",
+                "Content-Type": "application/json",
+                **(extra_headers or {})
+            },
+            json={
+                "model": self.model,
+                "max_tokens": 400,
+                "temperature": 0.7,
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ]
+            }
+        )
+        response.raise_for_status()
+        
+        result = response.json()
+        content = result["content"][0]["text"]
+        
+        try:
+            # Extract JSON from response
+            json_match = JSON_OBJECT_PATTERN.search(content)
+            if json_match:
+                return json.loads(json_match.group())
+            else:
+                raise ValueError("No JSON found in response")
+        except (json.JSONDecodeError, ValueError):
+            # Fallback
+            return {
+                "response": content[:200],  # Limit length
+                "follow_up_questions": [],
+                "emotional_tone": "conversational",
+                "support_provided": False
+            }
     
-    async def _generate_openai_response(self, prompt: str) -> Dict[str, Any]:
+    async def _generate_openai_response(self, prompt: str, extra_headers: Dict[str, str] = None) -> Dict[str, Any]:
         """Generate response using OpenAI API (fallback)"""
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                self.api_url,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": self.model,
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": "You are a concise AI companion for theater professionals. Respond with brief, helpful JSON."
-                        },
-                        {
-                            "role": "user", 
-                            "content": prompt
-                        }
-                    ],
-                    "temperature": 0.7,
-                    "max_tokens": 400
-                }
-            )
-            response.raise_for_status()
-            
-            result = response.json()
-            content = result["choices"][0]["message"]["content"]
-            
-            try:
-                return json.loads(content)
-            except json.JSONDecodeError:
-                return {
-                    "response": content[:200],
-                    "follow_up_questions": [],
-                    "emotional_tone": "conversational",
-                    "support_provided": False
-                }
+        response = await get_client().post(
+            self.api_url,
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+                **(extra_headers or {})
+            },
+            json={
+                "model": self.model,
+                "messages": [
+                    {
+                        "role": "system",
+                        "content": "You are a concise AI companion for theater professionals. Respond with brief, helpful JSON."
+                    },
+                    {
+                        "role": "user", 
+                        "content": prompt
+                    }
+                ],
+                "temperature": 0.7,
+                "max_tokens": 400
+            }
+        )
+        response.raise_for_status()
+        
+        result = response.json()
+        content = result["choices"][0]["message"]["content"]
+        
+        try:
+            return json.loads(content)
+        except json.JSONDecodeError:
+            return {
+                "response": content[:200],
+                "follow_up_questions": [],
+                "emotional_tone": "conversational",
+                "support_provided": False
+            }
     
     def _parse_response(self, response_data: Dict[str, Any], inputs: ChatInputs) -> ChatResult:
         """Parse LLM response into ChatResult"""
@@ -11,12 +11,16 @@ Can make progressive data requests through the orchestrator.
 """
 
 import os
+import re
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 import json
 import logging
 
-from capabilities.base import BaseCapability, CapabilityDescription
+import orjson
+
+from capabilities.base import BaseCapability, CapabilityDescription, truncate
+from services.frame_extractor import openai_client
 from models.capabilities import (
     CapabilityInputs, CapabilityResult,
     EventAnalysisInputs, EventAnalysisResult, 
@@ -29,6 +33,20 @@ from langchain.schema import HumanMessage, SystemMessage
 
 logger = logging.getLogger(__name__)
 
+# Pulls the JSON object out of the analysis response
+JSON_OBJECT_PATTERN = re.compile(r'\{.*\}', re.DOTALL)
+
+# Same system prompt for every analysis type
+ANALYST_SYSTEM_MESSAGE = SystemMessage(content="""You are a theater industry analytics expert. 
+Provide data-driven insights that are actionable and specific. 
+Be concise but thorough. 
+Always include confidence scores based on data quality and completeness.
+Suggest visualizations that would help communicate the insights.""")
+
+# Prompt budget for data rows: large results keep their first and last rows
+MAX_PROMPT_ROWS = 10
+MAX_CELL_CHARS = 200
+
 
 class EventAnalysisCapability(BaseCapability):
     """Intelligent analysis of event and ticketing data"""
@@ -37,7 +55,8 @@ class EventAnalysisCapability(BaseCapability):
         # Use LLM_TIER_PREMIUM for high-quality analysis
         self.llm = ChatOpenAI(
             model=os.getenv("LLM_TIER_PREMIUM", "gpt-4.1-2025-04-14"),
-            temperature=0.3
+            temperature=0.3,
+            http_async_client=openai_client()
         )
         logger.info(f"EventAnalysisCapability initialized with model: {self.llm.model_name}")
     
@@ -291,7 +310,7 @@ Return JSON:
         """Build prompt for general analysis"""
         
         data_summary = self._summarize_data_context(data_context)
-        context_str = json.dumps(criteria.context) if criteria.context else "No additional context"
+        context_str = orjson.dumps(criteria.context, default=str).decode() if criteria.context else "No additional context"
         
         return f"""
 You are a theater analytics expert providing insights on ticketing data.
@@ -334,7 +353,7 @@ Return JSON:
         
         # Look for task results from previous capability executions
         for key, value in data_context.items():
-            if isinstance(value, dict) and "data" in value:
+            if type(value) is dict and "data" in value:
                 summary_parts.append(f"\nData from {key}:")
                 
                 # If it has the structure of a TicketingDataResult
@@ -342,35 +361,86 @@ Return JSON:
                     summary_parts.append(f"Total rows: {value['total_rows']}")
                 
                 # Summarize the data points
-                data_points = value.get("data", [])[:10]  # First 10 rows
-                for dp in data_points:
-                    if isinstance(dp, dict):
-                        # Handle our DataPoint structure
-                        dims = dp.get("dimensions", {})
-                        measures = dp.get("measures", {})
-                        
-                        dim_str = ", ".join([f"{k}: {v}" for k, v in dims.items() if v])
-                        measure_str = ", ".join([f"{k}: {v}" for k, v in measures.items() if v])
-                        
-                        if dim_str and measure_str:
-                            summary_parts.append(f"  {dim_str} → {measure_str}")
-                        elif measure_str:
-                            summary_parts.append(f"  {measure_str}")
+                data_points, omitted = self._compress_rows(value.get("data", []))
+                summary_parts.extend(self._serialize_rows(data_points))
                 
-                if len(data_points) > 10:
-                    summary_parts.append(f"  ... and {len(data_points) - 10} more rows")
+                if omitted:
+                    summary_parts.append(f"  ({omitted} middle rows omitted)")
         
         return "\n".join(summary_parts) if summary_parts else "No data provided"
     
+    def _compress_rows(self, rows: List[Any], max_rows: int = MAX_PROMPT_ROWS) -> tuple:
+        """Cap rows for the prompt, keeping head and tail so trends keep both ends
+        
+        Returns the kept rows (in order) and the number of rows omitted.
+        """
+        if len(rows) <= max_rows:
+            return rows, 0
+        head = (max_rows + 1) // 2
+        tail = max_rows - head
+        return rows[:head] + rows[len(rows) - tail:], len(rows) - max_rows
+    
+    def _format_cell(self, value: Any) -> str:
+        """Compact a cell value: round decimals, truncate long strings"""
+        # Exact type checks: cells come from JSON, so no subclasses to consider
+        value_type = type(value)
+        if value is None:
+            return ""
+        if value_type is float:
+            return str(round(value, 2))
+        if value_type is int:
+            return str(value)
+        text = value if value_type is str else str(value)
+        # Cube.js returns numeric measures as strings like "1234.5600"
+        if value_type is str and "." in text:
+            try:
+                return str(round(float(text), 2))
+            except ValueError:
+                pass
+        return truncate(text, MAX_CELL_CHARS)
+    
+    def _serialize_rows(self, rows: List[Any]) -> List[str]:
+        """Serialize data rows columnar-style: field names once, then pipe-delimited rows
+        
+        Repeating every field name per row (as JSON or key: value pairs do) is
+        mostly token overhead for Cube.js results. Rows that are not records
+        fall back to JSON.
+        """
+        
+        records = []
+        columns = {}  # Ordered set of field names across all rows
+        other_rows = []
+        for row in rows:
+            if type(row) is not dict:
+                other_rows.append(f"  {orjson.dumps(row, default=str).decode()}")
+                continue
+            # Flatten our DataPoint structure (dimensions first, then measures)
+            if "dimensions" in row or "measures" in row:
+                record = {**row.get("dimensions", {}), **row.get("measures", {})}
+            else:
+                record = row
+            columns.update(dict.fromkeys(record))
+            records.append(record)
+        
+        lines = []
+        if records:
+            header = list(columns)
+            lines.append("  " + " | ".join(header))
+            for record in records:
+                lines.append("  " + " | ".join(
+                    self._format_cell(record.get(col)) for col in header
+                ))
+            # Label JSON fallbacks so they aren't read as rows of the table above
+            if other_rows:
+                lines.append("  Other rows:")
+        lines.extend(other_rows)
+        return lines
+    
     async def _get_llm_analysis(self, prompt: str) -> Dict[str, Any]:
         """Get analysis from LLM"""
         
         messages = [
-            SystemMessage(content="""You are a theater industry analytics expert. 
-Provide data-driven insights that are actionable and specific. 
-Be concise but thorough. 
-Always include confidence scores based on data quality and completeness.
-Suggest visualizations that would help communicate the insights."""),
+            ANALYST_SYSTEM_MESSAGE,
             HumanMessage(content=prompt)
         ]
         
@@ -378,8 +448,7 @@ Suggest visualizations that would help communicate the insights."""),
         
         # Parse JSON response
         try:
-            import re
-            json_match = re.search(r'\{.*\}', response.content, re.DOTALL)
+            json_match = JSON_OBJECT_PATTERN.search(response.content)
             if json_match:
                 return json.loads(json_match.group())
         except Exception as e:
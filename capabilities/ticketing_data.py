@@ -15,11 +15,15 @@ are handled by EventAnalysisCapability.
 """
 
 import os
+import re
+from string import Template
 from typing import Dict, Any, List, Optional
 import logging
 import json
 import asyncio
 
+import orjson
+
 from langchain_openai import ChatOpenAI
 from langchain.schema import HumanMessage, SystemMessage
 from pydantic import BaseModel
@@ -31,9 +35,246 @@ from models.capabilities import (
 )
 from services.cube_service import CubeService
 from services.cube_meta_service import CubeMetaService
+from services.frame_extractor import openai_client
 
 logger = logging.getLogger(__name__)
 
+# Query and plan responses may wrap the JSON in prose
+JSON_OBJECT_PATTERN = re.compile(r'\{.*\}', re.DOTALL)
+
+CUBE_FILTER_OPERATORS = [
+    "equals", "notEquals", "contains", "notContains",
+    "startsWith", "endsWith", "in", "notIn",
+    "gt", "gte", "lt", "lte",
+    "set", "notSet",
+    "inDateRange", "notInDateRange", "beforeDate", "afterDate"
+]
+
+# Dimensions the planner prompt flags as high cardinality; unbounded queries on
+# them are left to the planner, which adds limits (see MEMORY CONSIDERATIONS)
+HIGH_CARDINALITY_DIMENSIONS = frozenset({
+    "ticket_line_items.customer_id",
+    "ticket_line_items.city",
+    "ticket_line_items.postcode",
+    "events.id"
+})
+
+# System prompts depend only on the Cube.js schema, so they are rendered once per
+# schema load (see _build_query_context) and reused as a stable, cacheable prefix.
+# Template placeholders keep the JSON examples' braces literal.
+QUERY_GENERATOR_PROMPT = Template("""You are a Cube.js query generator for a live entertainment ticketing system. Generate queries that fetch the requested data efficiently.
+
+CONTEXT: This is a ticketing analytics system for theaters and live entertainment venues. The data includes ticket sales, productions (shows), events (performances), venues, and customer transactions.
+
+SCHEMA:
+$schema_json
+
+QUERY STRUCTURE:
+{
+  "measures": ["cube.measure"],      // What to calculate
+  "dimensions": ["cube.dimension"],  // How to group
+  "timeDimensions": [{              // Time-based grouping
+    "dimension": "cube.time_field",
+    "dateRange": ["2024-01-01", "2024-12-31"] or "last month",
+    "granularity": "day|week|month|quarter|year"  // REQUIRED if timeDimensions is used!
+  }],
+  // OR for time filtering without grouping:
+  "timeDimensions": [{
+    "dimension": "cube.time_field",
+    "dateRange": ["2024-01-01", "2024-12-31"]
+    // NO granularity field - omit it entirely for filtering only
+  }],
+  "filters": [{                     // Data filtering
+    "member": "cube.field",         // Always use "member" for filters
+    "operator": "equals|contains|gt|lt|inDateRange|...",
+    "values": ["value1", "value2"]
+  }],
+  // For complex filters, use AND/OR logic:
+  "filters": [
+    {"operator": "and", "filters": [
+      {"member": "productions.name", "operator": "equals", "values": ["Gatsby"]},
+      {"member": "ticket_line_items.amount", "operator": "gt", "values": [100]}
+    ]}
+  ],
+  "order": {"cube.field": "asc|desc"},  // Sort by single field
+  "limit": 100,                         // Max rows to return
+  "offset": 0,                          // Skip rows (for pagination)
+  "total": true                         // Return total count
+}
+
+ADDITIONAL FEATURES:
+- offset: Skip N rows for pagination (e.g., offset: 100)
+- total: Get total count of results (useful for pagination UI)
+- Hierarchical data: Use multiple dimensions (e.g., ["retailers.name", "sales_channels.name"])
+
+RULES:
+1. Use exact field names from schema (e.g., "ticket_line_items.amount")
+2. When user specifies a limit, use that exact number
+3. When adding any limit, also add order by the primary measure descending
+4. Use "member" (not "dimension") as the key in filter objects
+5. Empty order should be {} not []
+6. Common translations:
+   - "revenue" or "sales" → ticket_line_items.amount
+   - "attendance" or "tickets" → ticket_line_items.quantity
+   - "by show" or "by production" → productions.name
+7. For timeDimensions:
+   - If grouping by time, ALWAYS include valid granularity
+   - If just filtering by time, OMIT the granularity field entirely
+   - NEVER use "granularity": null
+
+MEMORY CONSIDERATIONS:
+Some dimensions have high cardinality (many unique values):
+- ticket_line_items.customer_id: millions of values
+- ticket_line_items.city/postcode: 50K+ values  
+- events.id with daily data: can be 50K+ rows
+
+When using these:
+- Add reasonable limits (100-1000 rows)
+- Or use coarser time granularity (weekly/monthly instead of daily)
+- Or filter to specific values first
+
+AVAILABLE OPERATORS:
+$operators_json
+
+EXAMPLES:
+
+1. Paginated results:
+{
+  "measures": ["ticket_line_items.amount"],
+  "dimensions": ["productions.name"],
+  "order": {"ticket_line_items.amount": "desc"},
+  "limit": 50,
+  "offset": 100,
+  "total": true
+}
+
+2. Hierarchical exploration (multiple dimensions):
+{
+  "measures": ["ticket_line_items.amount"],
+  "dimensions": ["retailers.name", "sales_channels.name", "productions.name"],
+  "order": {"ticket_line_items.amount": "desc"},
+  "limit": 50
+}
+
+3. Time filtering WITHOUT grouping (no granularity):
+{
+  "measures": ["ticket_line_items.amount"],
+  "dimensions": ["productions.name"],
+  "timeDimensions": [{
+    "dimension": "ticket_line_items.created_at_local",
+    "dateRange": ["2024-01-01", "2024-03-31"]
+    // NO granularity field here!
+  }],
+  "order": {"ticket_line_items.amount": "desc"},
+  "limit": 10
+}
+
+4. Time grouping WITH granularity:
+{
+  "measures": ["ticket_line_items.amount"],
+  "timeDimensions": [{
+    "dimension": "ticket_line_items.created_at_local",
+    "dateRange": "last 3 months",
+    "granularity": "month"  // REQUIRED for time grouping
+  }],
+  "order": {"ticket_line_items.created_at_local": "asc"}
+}
+
+NOTE: Use multiple dimensions for hierarchical data. NEVER use "granularity": null.
+
+Respond with ONLY the JSON query.""")
+
+QUERY_PLANNER_PROMPT = Template("""You are a Cube.js query planner. Determine if a request needs one query or multiple queries.
+
+SCHEMA:
+$schema_json
+
+NOTE: Cube.js automatically handles joins between cubes. You can use measures and dimensions from different cubes in a single query.
+
+WHEN TO USE MULTIPLE QUERIES:
+- Comparing separate time periods (Q1 vs Q2, 2023 vs 2024)
+- Keywords like "vs", "compare", "versus" between time periods
+- Explicitly stated "per production" or "per event" comparisons
+
+WHEN TO USE SINGLE QUERY:
+- Simple aggregations (even across cubes)
+- All data in one time range or no time specified
+- Basic grouping and filtering
+- Top N queries
+
+QUERY STRUCTURE:
+{
+  "measures": ["cube.measure"],
+  "dimensions": ["cube.dimension"],
+  "timeDimensions": [{
+    "dimension": "cube.time_field",
+    "dateRange": ["2024-01-01", "2024-12-31"] or "last month",
+    "granularity": "day|week|month|quarter|year"  // Include ONLY if grouping by time
+  }],
+  "filters": [{
+    "member": "cube.field",
+    "operator": "equals|contains|...",
+    "values": ["value"]
+  }],
+  "order": {"cube.field": "asc|desc"},
+  "limit": 100,
+  "offset": 0,
+  "total": true
+}
+
+IMPORTANT RULES FOR TIME DIMENSIONS:
+- If grouping by time: Include "granularity": "day|week|month|quarter|year"
+- If just filtering by time: OMIT the granularity field entirely
+- NEVER use "granularity": null - this causes errors!
+
+MEMORY CONSIDERATIONS (same as query generation):
+- ticket_line_items.customer_id: use limits
+- ticket_line_items.city/postcode: use limits  
+- events.id with daily: use weekly/monthly instead
+
+Return JSON:
+{
+    "strategy": "single" or "multi",
+    "reasoning": "Why this strategy",
+    "queries": [/* array of queries */],
+    "metadata": {}
+}
+
+EXAMPLE - Multi-fetch for Q1 vs Q2 comparison:
+{
+    "strategy": "multi",
+    "reasoning": "Comparing two separate quarters",
+    "queries": [
+        {
+            "measures": ["ticket_line_items.amount"],
+            "timeDimensions": [{
+                "dimension": "ticket_line_items.created_at_local",
+                "dateRange": ["2024-01-01", "2024-03-31"]
+                // No granularity - just filtering
+            }]
+        },
+        {
+            "measures": ["ticket_line_items.amount"],
+            "timeDimensions": [{
+                "dimension": "ticket_line_items.created_at_local",
+                "dateRange": ["2024-04-01", "2024-06-30"]
+                // No granularity - just filtering
+            }]
+        }
+    ],
+    "metadata": {"comparison": "Q1 vs Q2 2024"}
+}""")
+
+REQUEST_TEMPLATE = Template("""Request: $query_request
+Time context: $time_context
+
+Provided inputs:
+- Measures: $measures
+- Dimensions: $dimensions
+- Filters: $filters
+- Order: $order
+- Limit: $limit""")
+
 
 class QueryPlan(BaseModel):
     """Query execution plan from LLM"""
@@ -60,8 +301,12 @@ class TicketingDataCapability(BaseCapability):
         # Initialize LLM for query generation
         self.llm = ChatOpenAI(
             model=os.getenv("LLM_TIER_STANDARD", "gpt-4o-mini"),
-            temperature=0.1  # Low temperature for consistent query generation
+            temperature=0.1,  # Low temperature for consistent query generation
+            http_async_client=openai_client()
         )
+        
+        # Query context depends only on the Cube.js schema, so it is built once
+        self._query_context: Optional[Dict[str, Any]] = None
     
     def describe(self) -> CapabilityDescription:
         """Describe capability for orchestrator
@@ -116,53 +361,134 @@ class TicketingDataCapability(BaseCapability):
         5. Does NOT interpret or analyze results
         """
         
-        logger.info(f"Processing data request: {getattr(inputs, 'query_request', 'No description')}")
+        logger.info(f"Processing data request: {inputs.query_request or 'No description'}")
         
         try:
-            # Build comprehensive context for query generation
-            context = await self._build_query_context(inputs)
-            
-            # Generate query plan using LLM - it decides single vs multi-fetch
-            query_plan = await self._generate_query_plan(inputs, context)
+            query_plan = await self._plan_query(inputs)
             
             if not query_plan or not query_plan.queries:
-                return TicketingDataResult(
-                    success=False,
-                    data=[],
-                    total_rows=0,
-                    total_columns=0,
-                    total_measures=0,
-                    assumptions=["Could not generate a valid query plan"],
-                    query_metadata={"error": "Query planning failed"}
-                )
+                return self._planning_failed_result()
             
             logger.info(f"Query plan: {query_plan.strategy} strategy with {len(query_plan.queries)} queries")
-            
-            # Execute based on strategy
-            if query_plan.strategy == "single":
-                # Single query path
-                query = query_plan.queries[0]
-                result = await self._execute_single_query(query, inputs.tenant_id)
-                return self._format_single_result(result, query, query_plan)
-            else:
-                # Multi-fetch path
-                results = await self._execute_multi_fetch(query_plan, inputs.tenant_id)
-                return self._format_multi_result(results, query_plan)
+            return await self._run_plan(query_plan, inputs.tenant_id)
             
         except Exception as e:
             logger.error(f"Error fetching ticketing data: {e}", exc_info=True)
-            return TicketingDataResult(
-                success=False,
-                data=[],
-                query_metadata={"error": str(e)},
-                total_rows=0,
-                total_columns=0,
-                total_measures=0,
-                assumptions=[f"Query failed: {str(e)}"]
-            )
+            return self._error_result(e)
     
-    async def _build_query_context(self, inputs: TicketingDataInputs) -> Dict[str, Any]:
-        """Build comprehensive context from real Cube.js schema"""
+    async def execute_batch(self, inputs_list: List[TicketingDataInputs]) -> List[TicketingDataResult]:
+        """Execute several data requests, coalescing single-query plans per tenant
+        
+        Plans are generated concurrently. Plain single-query plans for the same tenant
+        are sent to Cube.js as one multi-query round-trip; multi-fetch and
+        compareDateRange plans run as they would in execute(). Results keep input order.
+        """
+        plans = await asyncio.gather(
+            *(self._plan_query(inputs) for inputs in inputs_list),
+            return_exceptions=True
+        )
+        
+        results: List[Optional[TicketingDataResult]] = [None] * len(inputs_list)
+        batches: Dict[str, List[int]] = {}
+        pending = []
+        
+        for i, (inputs, plan) in enumerate(zip(inputs_list, plans)):
+            if isinstance(plan, Exception):
+                logger.error(f"Planning failed for batch item {i}: {plan}")
+                results[i] = self._error_result(plan)
+            elif not plan or not plan.queries:
+                results[i] = self._planning_failed_result()
+            elif plan.strategy == "single" and not self._is_compare_query(plan.queries[0]):
+                batches.setdefault(inputs.tenant_id, []).append(i)
+            else:
+                pending.append(i)
+        
+        async def run_batch(tenant_id: str, indices: List[int]) -> None:
+            queries = [plans[i].queries[0] for i in indices]
+            try:
+                cube_results = await self.cube_service.query_batch(queries, tenant_id)
+            except Exception as e:
+                logger.error(f"Batch query failed for tenant {tenant_id}: {e}", exc_info=True)
+                for i in indices:
+                    results[i] = self._error_result(e)
+                return
+            for i, query, cube_result in zip(indices, queries, cube_results):
+                results[i] = self._format_single_result(cube_result, query, plans[i])
+        
+        async def run_single(i: int) -> None:
+            try:
+                results[i] = await self._run_plan(plans[i], inputs_list[i].tenant_id)
+            except Exception as e:
+                logger.error(f"Error fetching ticketing data: {e}", exc_info=True)
+                results[i] = self._error_result(e)
+        
+        await asyncio.gather(
+            *(run_batch(tenant_id, indices) for tenant_id, indices in batches.items()),
+            *(run_single(i) for i in pending)
+        )
+        
+        # A short batch response leaves trailing slots unfilled
+        return [result or self._error_result(ValueError("No result returned for query")) for result in results]
+    
+    async def _plan_query(self, inputs: TicketingDataInputs) -> Optional[QueryPlan]:
+        """Build the query context and pick a query plan"""
+        # Build comprehensive context for query generation
+        context = await self._build_query_context(inputs)
+        
+        # Structured inputs that already form a valid query skip the planner;
+        # otherwise the LLM decides single vs multi-fetch
+        query_plan = self._direct_query_plan(inputs, context)
+        if query_plan:
+            logger.info("Inputs form a complete query - skipping LLM planning")
+            return query_plan
+        return await self._generate_query_plan(inputs, context)
+    
+    async def _run_plan(self, query_plan: QueryPlan, tenant_id: str) -> TicketingDataResult:
+        """Execute a query plan based on its strategy"""
+        if query_plan.strategy == "single":
+            # Single query path
+            query = query_plan.queries[0]
+            result = await self._execute_single_query(query, tenant_id)
+            return self._format_single_result(result, query, query_plan)
+        else:
+            # Multi-fetch path
+            results = await self._execute_multi_fetch(query_plan, tenant_id)
+            return self._format_multi_result(results, query_plan)
+    
+    @staticmethod
+    def _is_compare_query(query: Dict[str, Any]) -> bool:
+        """compareDateRange queries are multi-queries themselves and cannot be batched"""
+        return any("compareDateRange" in td for td in query.get("timeDimensions") or [])
+    
+    @staticmethod
+    def _planning_failed_result() -> TicketingDataResult:
+        return TicketingDataResult(
+            success=False,
+            data=[],
+            total_rows=0,
+            total_columns=0,
+            total_measures=0,
+            assumptions=["Could not generate a valid query plan"],
+            query_metadata={"error": "Query planning failed"}
+        )
+    
+    @staticmethod
+    def _error_result(error: Exception) -> TicketingDataResult:
+        return TicketingDataResult(
+            success=False,
+            data=[],
+            query_metadata={"error": str(error)},
+            total_rows=0,
+            total_columns=0,
+            total_measures=0,
+            assumptions=[f"Query failed: {str(error)}"]
+        )
+    
+    async def _build_query_context(self, inputs: Optional[TicketingDataInputs] = None) -> Dict[str, Any]:
+        """Build comprehensive context from real Cube.js schema (cached, see refresh_schema)"""
+        if self._query_context is not None:
+            return self._query_context
+        
         # Get full schema information
         try:
             schema = await self.meta_service.get_meta()
@@ -197,164 +523,66 @@ class TicketingDataCapability(BaseCapability):
                 "all_dimensions": [],
                 "all_measures": []
             }
+            schema_loaded = False
+        else:
+            schema_loaded = True
         
-        return {
+        time_dimensions = {d for cube in structured_schema["cubes"] for d in cube["timeDimensions"]}
+        context = {
             "schema": structured_schema,
-            "all_operators": [
-                "equals", "notEquals", "contains", "notContains",
-                "startsWith", "endsWith", "in", "notIn",
-                "gt", "gte", "lt", "lte",
-                "set", "notSet",
-                "inDateRange", "notInDateRange", "beforeDate", "afterDate"
-            ]
+            # Membership sets for validating structured inputs
+            "measure_set": frozenset(structured_schema["all_measures"]),
+            "dimension_set": frozenset(structured_schema["all_dimensions"]) - time_dimensions,
         }
+        
+        # Pre-rendered once for the prompt builders
+        schema_json = orjson.dumps(structured_schema, option=orjson.OPT_INDENT_2).decode()
+        context["query_system_prompt"] = QUERY_GENERATOR_PROMPT.substitute(
+            schema_json=schema_json,
+            operators_json=orjson.dumps(CUBE_FILTER_OPERATORS).decode()
+        )
+        context["planner_system_prompt"] = QUERY_PLANNER_PROMPT.substitute(schema_json=schema_json)
+        
+        # Don't cache the empty fallback - retry the schema on the next request
+        if schema_loaded:
+            self._query_context = context
+        return context
+    
+    async def prefetch_schema(self) -> None:
+        """Warm the cached query context ahead of the first data request"""
+        await self._build_query_context()
+    
+    async def refresh_schema(self) -> None:
+        """Reload the Cube.js schema and drop the cached query context after it changes"""
+        await self.meta_service.refresh_meta()
+        self._query_context = None
+    
+    @staticmethod
+    def _describe_request(inputs: TicketingDataInputs) -> str:
+        """Request and provided inputs, shared by the query generator and planner prompts"""
+        return REQUEST_TEMPLATE.substitute(
+            query_request=inputs.query_request or 'Not specified',
+            time_context=inputs.time_context or 'Not specified',
+            measures=inputs.measures,
+            dimensions=inputs.dimensions if inputs.dimensions else 'none',
+            filters=[f.model_dump() for f in inputs.filters] if inputs.filters else 'none',
+            order=inputs.order if inputs.order else 'none',
+            limit=inputs.limit if inputs.limit else 'none'
+        )
     
     async def _generate_advanced_query(self, inputs: TicketingDataInputs, context: Dict[str, Any]) -> Dict[str, Any]:
         """Generate sophisticated Cube.js query using all available features"""
         
-        # Build comprehensive prompt with all Cube.js capabilities
-        # Avoid f-string to prevent issues with JSON examples containing braces
-        schema_json = json.dumps(context['schema'], indent=2)
-        operators_json = json.dumps(context['all_operators'])
-        
-        system_prompt = """You are a Cube.js query generator for a live entertainment ticketing system. Generate queries that fetch the requested data efficiently.
-
-CONTEXT: This is a ticketing analytics system for theaters and live entertainment venues. The data includes ticket sales, productions (shows), events (performances), venues, and customer transactions.
-
-SCHEMA:
-""" + schema_json + """
-
-QUERY STRUCTURE:
-{
-  "measures": ["cube.measure"],      // What to calculate
-  "dimensions": ["cube.dimension"],  // How to group
-  "timeDimensions": [{              // Time-based grouping
-    "dimension": "cube.time_field",
-    "dateRange": ["2024-01-01", "2024-12-31"] or "last month",
-    "granularity": "day|week|month|quarter|year"  // REQUIRED if timeDimensions is used!
-  }],
-  // OR for time filtering without grouping:
-  "timeDimensions": [{
-    "dimension": "cube.time_field",
-    "dateRange": ["2024-01-01", "2024-12-31"]
-    // NO granularity field - omit it entirely for filtering only
-  }],
-  "filters": [{                     // Data filtering
-    "member": "cube.field",         // Always use "member" for filters
-    "operator": "equals|contains|gt|lt|inDateRange|...",
-    "values": ["value1", "value2"]
-  }],
-  // For complex filters, use AND/OR logic:
-  "filters": [
-    {"operator": "and", "filters": [
-      {"member": "productions.name", "operator": "equals", "values": ["Gatsby"]},
-      {"member": "ticket_line_items.amount", "operator": "gt", "values": [100]}
-    ]}
-  ],
-  "order": {"cube.field": "asc|desc"},  // Sort by single field
-  "limit": 100,                         // Max rows to return
-  "offset": 0,                          // Skip rows (for pagination)
-  "total": true                         // Return total count
-}
-
-ADDITIONAL FEATURES:
-- offset: Skip N rows for pagination (e.g., offset: 100)
-- total: Get total count of results (useful for pagination UI)
-- Hierarchical data: Use multiple dimensions (e.g., ["retailers.name", "sales_channels.name"])
-
-RULES:
-1. Use exact field names from schema (e.g., "ticket_line_items.amount")
-2. When user specifies a limit, use that exact number
-3. When adding any limit, also add order by the primary measure descending
-4. Use "member" (not "dimension") as the key in filter objects
-5. Empty order should be {} not []
-6. Common translations:
-   - "revenue" or "sales" → ticket_line_items.amount
-   - "attendance" or "tickets" → ticket_line_items.quantity
-   - "by show" or "by production" → productions.name
-7. For timeDimensions:
-   - If grouping by time, ALWAYS include valid granularity
-   - If just filtering by time, OMIT the granularity field entirely
-   - NEVER use "granularity": null
-
-MEMORY CONSIDERATIONS:
-Some dimensions have high cardinality (many unique values):
-- ticket_line_items.customer_id: millions of values
-- ticket_line_items.city/postcode: 50K+ values  
-- events.id with daily data: can be 50K+ rows
-
-When using these:
-- Add reasonable limits (100-1000 rows)
-- Or use coarser time granularity (weekly/monthly instead of daily)
-- Or filter to specific values first
-
-AVAILABLE OPERATORS:
-""" + operators_json + """
-
-EXAMPLES:
-
-1. Paginated results:
-{
-  "measures": ["ticket_line_items.amount"],
-  "dimensions": ["productions.name"],
-  "order": {"ticket_line_items.amount": "desc"},
-  "limit": 50,
-  "offset": 100,
-  "total": true
-}
-
-2. Hierarchical exploration (multiple dimensions):
-{
-  "measures": ["ticket_line_items.amount"],
-  "dimensions": ["retailers.name", "sales_channels.name", "productions.name"],
-  "order": {"ticket_line_items.amount": "desc"},
-  "limit": 50
-}
-
-3. Time filtering WITHOUT grouping (no granularity):
-{
-  "measures": ["ticket_line_items.amount"],
-  "dimensions": ["productions.name"],
-  "timeDimensions": [{
-    "dimension": "ticket_line_items.created_at_local",
-    "dateRange": ["2024-01-01", "2024-03-31"]
-    // NO granularity field here!
-  }],
-  "order": {"ticket_line_items.amount": "desc"},
-  "limit": 10
-}
-
-4. Time grouping WITH granularity:
-{
-  "measures": ["ticket_line_items.amount"],
-  "timeDimensions": [{
-    "dimension": "ticket_line_items.created_at_local",
-    "dateRange": "last 3 months",
-    "granularity": "month"  // REQUIRED for time grouping
-  }],
-  "order": {"ticket_line_items.created_at_local": "asc"}
-}
-
-NOTE: Use multiple dimensions for hierarchical data. NEVER use "granularity": null.
-
-Respond with ONLY the JSON query."""
+        system_prompt = context['query_system_prompt']
 
         user_prompt = f"""Generate a Cube.js query for:
 
-Request: {getattr(inputs, 'query_request', 'Not specified')}
-Time context: {getattr(inputs, 'time_context', 'Not specified')}
-
-Provided inputs:
-- Measures: {inputs.measures}
-- Dimensions: {inputs.dimensions if inputs.dimensions else 'none'}
-- Filters: {[f.model_dump() for f in inputs.filters] if inputs.filters else 'none'}
-- Order: {inputs.order if inputs.order else 'none'}
-- Limit: {inputs.limit if inputs.limit else 'none'}
+{self._describe_request(inputs)}
 
 If a specific limit is provided above, use that exact number."""
 
         # Log the user prompt for debugging
-        logger.info(f"User prompt: {user_prompt}")
+        logger.debug("User prompt: %s", user_prompt)
         
         response = await self.llm.ainvoke([
             SystemMessage(content=system_prompt),
@@ -362,8 +590,7 @@ If a specific limit is provided above, use that exact number."""
         ])
         
         # Parse JSON response
-        import re
-        json_match = re.search(r'\{.*\}', response.content, re.DOTALL)
+        json_match = JSON_OBJECT_PATTERN.search(response.content)
         if json_match:
             query = json.loads(json_match.group())
             # Ensure order is always present
@@ -384,119 +611,77 @@ If a specific limit is provided above, use that exact number."""
     def _transform_cube_data_to_datapoints(self, cube_data: List[Dict], query: Dict) -> List[DataPoint]:
         """Transform Cube.js response rows to DataPoints"""
         data_points = []
+        # Classify columns with one set lookup per cell instead of a list scan
+        measure_keys = frozenset(query.get("measures", []))
         for row in cube_data:
             dimensions = {}
             measures = {}
             
             for key, value in row.items():
-                if key in query.get("measures", []):
+                if key in measure_keys:
                     measures[key] = value
                 else:
                     dimensions[key] = value
             
-            data_points.append(DataPoint(
+            # Rows come straight from Cube.js as str-keyed dicts, so skip validation
+            data_points.append(DataPoint.model_construct(
                 dimensions=dimensions,
                 measures=measures
             ))
         return data_points
     
+    @staticmethod
+    def _direct_query_plan(inputs: TicketingDataInputs, context: Dict[str, Any]) -> Optional[QueryPlan]:
+        """Build a single-query plan without the LLM when inputs are already a complete query
+        
+        Only applies when there is no natural language to interpret (no query_request
+        or time context) and every member exists in the schema. Time dimensions are
+        excluded since they need granularity handling from the planner, and so are
+        unbounded high-cardinality groupings, which the planner limits.
+        """
+        if inputs.query_request or inputs.time_context or inputs.time_comparison_type:
+            return None
+        if not inputs.measures:
+            return None
+        if not inputs.limit and any(d in HIGH_CARDINALITY_DIMENSIONS for d in inputs.dimensions):
+            return None
+        
+        measure_set = context["measure_set"]
+        dimension_set = context["dimension_set"]
+        if not all(m in measure_set for m in inputs.measures):
+            return None
+        if not all(d in dimension_set for d in inputs.dimensions):
+            return None
+        if not all(f.member in measure_set or f.member in dimension_set for f in inputs.filters):
+            return None
+        
+        query: Dict[str, Any] = {
+            "measures": list(inputs.measures),
+            "dimensions": list(inputs.dimensions),
+            "filters": [f.model_dump() for f in inputs.filters]
+        }
+        if inputs.order:
+            query["order"] = inputs.order
+        if inputs.limit:
+            query["limit"] = inputs.limit
+            # Same default as generated queries: a limit without order keeps the top rows
+            if not inputs.order:
+                query["order"] = {inputs.measures[0]: "desc"}
+        
+        return QueryPlan(
+            strategy="single",
+            reasoning="Structured inputs used as-is",
+            queries=[query]
+        )
+    
     async def _generate_query_plan(self, inputs: TicketingDataInputs, context: Dict[str, Any]) -> QueryPlan:
         """Generate query execution plan using LLM"""
         
-        schema_json = json.dumps(context['schema'], indent=2)
-        
-        system_prompt = f"""You are a Cube.js query planner. Determine if a request needs one query or multiple queries.
-
-SCHEMA:
-{schema_json}
-
-NOTE: Cube.js automatically handles joins between cubes. You can use measures and dimensions from different cubes in a single query.
-
-WHEN TO USE MULTIPLE QUERIES:
-- Comparing separate time periods (Q1 vs Q2, 2023 vs 2024)
-- Keywords like "vs", "compare", "versus" between time periods
-- Explicitly stated "per production" or "per event" comparisons
-
-WHEN TO USE SINGLE QUERY:
-- Simple aggregations (even across cubes)
-- All data in one time range or no time specified
-- Basic grouping and filtering
-- Top N queries
-
-QUERY STRUCTURE:
-{{
-  "measures": ["cube.measure"],
-  "dimensions": ["cube.dimension"],
-  "timeDimensions": [{{
-    "dimension": "cube.time_field",
-    "dateRange": ["2024-01-01", "2024-12-31"] or "last month",
-    "granularity": "day|week|month|quarter|year"  // Include ONLY if grouping by time
-  }}],
-  "filters": [{{
-    "member": "cube.field",
-    "operator": "equals|contains|...",
-    "values": ["value"]
-  }}],
-  "order": {{"cube.field": "asc|desc"}},
-  "limit": 100,
-  "offset": 0,
-  "total": true
-}}
-
-IMPORTANT RULES FOR TIME DIMENSIONS:
-- If grouping by time: Include "granularity": "day|week|month|quarter|year"
-- If just filtering by time: OMIT the granularity field entirely
-- NEVER use "granularity": null - this causes errors!
-
-MEMORY CONSIDERATIONS (same as query generation):
-- ticket_line_items.customer_id: use limits
-- ticket_line_items.city/postcode: use limits  
-- events.id with daily: use weekly/monthly instead
-
-Return JSON:
-{{
-    "strategy": "single" or "multi",
-    "reasoning": "Why this strategy",
-    "queries": [/* array of queries */],
-    "metadata": {{}}
-}}
-
-EXAMPLE - Multi-fetch for Q1 vs Q2 comparison:
-{{
-    "strategy": "multi",
-    "reasoning": "Comparing two separate quarters",
-    "queries": [
-        {{
-            "measures": ["ticket_line_items.amount"],
-            "timeDimensions": [{{
-                "dimension": "ticket_line_items.created_at_local",
-                "dateRange": ["2024-01-01", "2024-03-31"]
-                // No granularity - just filtering
-            }}]
-        }},
-        {{
-            "measures": ["ticket_line_items.amount"],
-            "timeDimensions": [{{
-                "dimension": "ticket_line_items.created_at_local",
-                "dateRange": ["2024-04-01", "2024-06-30"]
-                // No granularity - just filtering
-            }}]
-        }}
-    ],
-    "metadata": {{"comparison": "Q1 vs Q2 2024"}}
-}}"""
+        system_prompt = context['planner_system_prompt']
 
         user_prompt = f"""Plan queries for:
 
-Request: {getattr(inputs, 'query_request', 'Not specified')}
-Time context: {getattr(inputs, 'time_context', 'Not specified')}
-
-Provided inputs:
-- Measures: {inputs.measures}
-- Dimensions: {inputs.dimensions if inputs.dimensions else 'none'}
-- Filters: {[f.model_dump() for f in inputs.filters] if inputs.filters else 'none'}
-- Order: {inputs.order if inputs.order else 'none'}
-- Limit: {inputs.limit if inputs.limit else 'none'}
+{self._describe_request(inputs)}
 
 If a specific limit is provided, use that exact number in all queries."""
 
@@ -507,8 +692,7 @@ If a specific limit is provided, use that exact number in all queries."""
         
         # Parse JSON response
         try:
-            import re
-            json_match = re.search(r'\{.*\}', response.content, re.DOTALL)
+            json_match = JSON_OBJECT_PATTERN.search(response.content)
             if json_match:
                 plan_data = json.loads(json_match.group())
                 return QueryPlan(**plan_data)
@@ -541,37 +725,29 @@ If a specific limit is provided, use that exact number in all queries."""
         # Limit to 3 parallel queries
         queries_to_execute = query_plan.queries[:3]
         
-        # Execute queries in parallel
-        tasks = []
-        for i, query in enumerate(queries_to_execute):
-            task = self._execute_single_query(query, tenant_id)
-            tasks.append((i, task))
+        # Execute queries in parallel - the coroutines only overlap once gathered
+        outcomes = await asyncio.gather(
+            *(self._execute_single_query(query, tenant_id) for query in queries_to_execute),
+            return_exceptions=True
+        )
         
-        # Gather results with error handling
+        # Collect results with error handling
         results = []
-        failed_queries = []
-        
-        for i, task in tasks:
-            try:
-                result = await task
+        for i, (query, outcome) in enumerate(zip(queries_to_execute, outcomes)):
+            if isinstance(outcome, Exception):
+                logger.error(f"Query {i} failed: {outcome}")
                 results.append({
                     "index": i,
-                    "success": True,
-                    "data": result,
-                    "query": queries_to_execute[i]
-                })
-            except Exception as e:
-                logger.error(f"Query {i} failed: {e}")
-                failed_queries.append({
-                    "index": i,
-                    "error": str(e),
-                    "query": queries_to_execute[i]
+                    "success": False,
+                    "error": str(outcome),
+                    "query": query
                 })
+            else:
                 results.append({
                     "index": i,
-                    "success": False,
-                    "error": str(e),
-                    "query": queries_to_execute[i]
+                    "success": True,
+                    "data": outcome,
+                    "query": query
                 })
         
         return results
@@ -36,6 +36,10 @@ CREATE TABLE production_info (
 CREATE INDEX idx_entities_trigram ON entities USING gin(name gin_trgm_ops);
 CREATE INDEX idx_entities_type_tenant ON entities(tenant_id, entity_type);
 CREATE INDEX idx_entities_name ON entities(name);
+-- Serve exact lower(name) probes and LIKE prefix scans for short inputs,
+-- typed and cross-type (entity_type as the middle key blocks the range scan)
+CREATE INDEX idx_entities_lname ON entities(tenant_id, entity_type, lower(name) text_pattern_ops);
+CREATE INDEX idx_entities_tenant_lname ON entities(tenant_id, lower(name) text_pattern_ops);
 
 -- Indexes for production info
 CREATE INDEX idx_production_info_dates ON production_info(first_date, last_date);
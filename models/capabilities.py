@@ -94,6 +94,24 @@ class TicketingDataResult(CapabilityResult):
     total_columns: int = 0
     total_measures: int = 0
     assumptions: List[str] = Field(default_factory=list)  # What was assumed during query
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Same shape as model_dump(), built directly
+        
+        Results can hold thousands of DataPoints; this skips pydantic's
+        per-row introspection and deep copies (row dicts are shared, not copied).
+        """
+        return {
+            "success": self.success,
+            "timestamp": self.timestamp,
+            "metadata": self.metadata,
+            "data": [{"dimensions": dp.dimensions, "measures": dp.measures} for dp in self.data],
+            "query_metadata": self.query_metadata,
+            "total_rows": self.total_rows,
+            "total_columns": self.total_columns,
+            "total_measures": self.total_measures,
+            "assumptions": self.assumptions
+        }
 
 
 # === Event Analysis Capability Models ===
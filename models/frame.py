@@ -9,7 +9,7 @@ Focus on extracting only what needs resolution:
 
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
-from datetime import datetime
+from datetime import datetime, date
 import uuid
 
 
@@ -133,9 +133,9 @@ class EntityCandidate(BaseModel):
     disambiguation: str = Field(..., description="Human-readable disambiguation string")
     data: Optional[Dict[str, Any]] = Field(None, description="Additional entity data")
     # Disambiguation fields from our database
-    sold_last_30_days: Optional[int] = None
-    first_date: Optional[datetime] = None
-    last_date: Optional[datetime] = None
+    sold_last_30_days: Optional[float] = None
+    first_date: Optional[date] = None
+    last_date: Optional[date] = None
 
 
 # Forward reference resolution
@@ -6,6 +6,7 @@ Each state group handles related functionality for clarity and maintainability
 from typing import Dict, List, Optional, Any, Literal
 from pydantic import BaseModel, Field
 from datetime import datetime
+from itertools import islice
 
 from models.frame import Frame
 
@@ -39,6 +40,7 @@ class CoreState(BaseModel):
     status: Literal["processing", "complete", "error"] = "processing"
     current_node: Optional[str] = None
     messages: List[Message] = Field(default_factory=list)
+    error_messages: List[str] = Field(default_factory=list)  # Failures recorded by nodes, newest last
     final_response: Optional[Dict[str, Any]] = None
 
 
@@ -46,11 +48,13 @@ class SemanticState(BaseModel):
     """All semantic understanding - Frame-based"""
     frames: List[Frame] = Field(default_factory=list)
     current_frame_id: Optional[str] = None
+    frame_contexts: Dict[str, str] = Field(default_factory=dict)  # Rendered orchestration context per frame_id
 
 
 class ExecutionState(BaseModel):
     """Task execution with single-task pattern"""
     completed_tasks: Dict[str, TaskResult] = Field(default_factory=dict)
+    current_task: Optional[Dict[str, Any]] = None  # Task the orchestrator last dispatched
     loop_count: int = 0  # Simple loop protection
     
     def add_task_result(self, task_result: TaskResult) -> None:
@@ -62,10 +66,8 @@ class ExecutionState(BaseModel):
         return self.completed_tasks.get(task_id)
     
     def get_recent_results(self, limit: int = 3) -> List[TaskResult]:
-        """Get most recent task results"""
-        results = list(self.completed_tasks.values())
-        results.sort(key=lambda x: x.timestamp, reverse=True)
-        return results[:limit]
+        """Get most recent task results (completed_tasks is insertion-ordered)"""
+        return list(islice(reversed(self.completed_tasks.values()), limit))
 
 
 class RoutingState(BaseModel):
@@ -86,11 +88,30 @@ class MemoryState(BaseModel):
             self.conversation_history = self.conversation_history[-10:]
 
 
+class NodeProfile(BaseModel):
+    """Accumulated wall-clock timing for one workflow node"""
+    call_count: int = 0
+    total_ns: int = 0
+    max_ns: int = 0
+    
+    def record(self, elapsed_ns: int) -> None:
+        """Add one node execution"""
+        self.call_count += 1
+        self.total_ns += elapsed_ns
+        self.max_ns = max(self.max_ns, elapsed_ns)
+
+
 class DebugState(BaseModel):
     """Optional debug information"""
     trace_enabled: bool = False
     trace_events: List[Dict[str, Any]] = Field(default_factory=list)
     performance_metrics: Dict[str, Any] = Field(default_factory=dict)
+    node_profiles: Dict[str, NodeProfile] = Field(default_factory=dict)
+    
+    def record_node_timing(self, node: str, elapsed_ns: int) -> None:
+        """Record how long a node took (per node: calls, total, max)"""
+        if self.trace_enabled:
+            self.node_profiles.setdefault(node, NodeProfile()).record(elapsed_ns)
     
     def add_trace_event(self, event: str, data: Dict[str, Any]) -> None:
         """Add debug trace event"""
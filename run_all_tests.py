@@ -32,7 +32,8 @@ def check_environment():
 
 def run_tests(marker=None):
     """Run pytest with optional marker"""
-    cmd = ['python', '-m', 'pytest', 'tests/', '-v']
+    # Files run in parallel on separate workers; each keeps its session fixtures
+    cmd = ['python', '-m', 'pytest', 'tests/', '-v', '-n', 'auto', '--dist=loadfile']
     
     if marker:
         cmd.extend(['-m', marker])
@@ -1,5 +1,6 @@
 """Debug assumptions"""
 import asyncio
+import uvloop
 import os
 from capabilities.ticketing_data import TicketingDataCapability
 from models.capabilities import TicketingDataInputs
@@ -22,4 +23,8 @@ async def debug():
     print(f"Assumptions: {result.assumptions}")
 
 if __name__ == "__main__":
-    asyncio.run(debug())
\ No newline at end of file
+    # DEBUG_ASYNCIO=1 keeps the stock loop for slow-callback tracing
+    if os.getenv("DEBUG_ASYNCIO"):
+        asyncio.run(debug(), debug=True)
+    else:
+        uvloop.run(debug())
\ No newline at end of file
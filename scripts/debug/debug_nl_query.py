@@ -2,8 +2,9 @@
 Debug natural language query generation
 """
 import asyncio
+import uvloop
 import os
-import json
+import orjson
 from capabilities.ticketing_data import TicketingDataCapability
 from models.capabilities import TicketingDataInputs
 
@@ -32,8 +33,12 @@ async def debug_nl_query():
     print(f"\nGenerated Queries:")
     for i, query in enumerate(query_plan.queries):
         print(f"\nQuery {i+1}:")
-        print(json.dumps(query, indent=2))
+        print(orjson.dumps(query, option=orjson.OPT_INDENT_2).decode())
 
 
 if __name__ == "__main__":
-    asyncio.run(debug_nl_query())
\ No newline at end of file
+    # DEBUG_ASYNCIO=1 keeps the stock loop for slow-callback tracing
+    if os.getenv("DEBUG_ASYNCIO"):
+        asyncio.run(debug_nl_query(), debug=True)
+    else:
+        uvloop.run(debug_nl_query())
\ No newline at end of file
@@ -8,7 +8,7 @@ will later interpret.
 Run: docker-compose run --rm test python demo_ticketing_capability.py
 """
 
-import asyncio
+import uvloop
 import os
 import json
 from datetime import datetime
@@ -181,4 +181,4 @@ async def main():
     print("\nNext: Implement EventAnalysisCapability for intelligent analysis")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    uvloop.run(main())
\ No newline at end of file
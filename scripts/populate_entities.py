@@ -15,6 +15,7 @@ Docker usage:
 """
 
 import asyncio
+import uvloop
 import asyncpg
 import json
 import os
@@ -188,15 +189,15 @@ async def populate_database(
         # Clear existing data
         await clear_entities_tables(database_url, tenant_id)
         
-        # Fetch productions with all their data in one query
-        print("📊 Fetching productions with dates...")
-        productions = await fetch_productions_with_dates(cube_service, tenant_id)
+        # Productions (all their data in one query) and sold_last_30_days are
+        # independent queries - run them together over the shared Cube.js client
+        print("📊 Fetching productions with dates and sold_last_30_days data...")
+        productions, sold_last_30_days_data = await asyncio.gather(
+            fetch_productions_with_dates(cube_service, tenant_id),
+            fetch_sold_last_30_days(cube_service, tenant_id)
+        )
         print(f"  Found {len(productions)} productions")
         
-        # Fetch sold_last_30_days data
-        print("📊 Fetching sold_last_30_days data...")
-        sold_last_30_days_data = await fetch_sold_last_30_days(cube_service, tenant_id)
-        
         # Start with production entities
         all_entities = productions
         
@@ -207,23 +208,31 @@ async def populate_database(
         # Skip productions (already fetched) and problematic types
         skip_types = {'productions', 'production', 'venues', 'venue', 'customers', 'customer'}
         
+        configs = {}
         for entity_type in entity_types:
             if entity_type in skip_types:
                 continue
-                
-            print(f"📊 Fetching {entity_type} entities...")
+            
             config = await meta_service.get_entity_config(entity_type)
             
             if not config:
                 print(f"  ❌ No config found for {entity_type}")
                 continue
-            
-            try:
-                entities = await fetch_entities_from_config(cube_service, entity_type, config, tenant_id)
-                print(f"  Found {len(entities)} {entity_type} entities")
-                all_entities.extend(entities)
-            except Exception as e:
-                print(f"  ❌ Failed to fetch {entity_type}: {e}")
+            configs[entity_type] = config
+        
+        # One query per entity type, all in flight at once
+        print(f"📊 Fetching {', '.join(configs)} entities...")
+        outcomes = await asyncio.gather(
+            *(fetch_entities_from_config(cube_service, entity_type, config, tenant_id)
+              for entity_type, config in configs.items()),
+            return_exceptions=True
+        )
+        for entity_type, outcome in zip(configs, outcomes):
+            if isinstance(outcome, Exception):
+                print(f"  ❌ Failed to fetch {entity_type}: {outcome}")
+            else:
+                print(f"  Found {len(outcome)} {entity_type} entities")
+                all_entities.extend(outcome)
         
         # Insert all entities
         print(f"\n💾 Inserting {len(all_entities)} entities...")
@@ -298,7 +307,7 @@ if __name__ == "__main__":
     
     if args.clear_only:
         # Just clear tables
-        asyncio.run(clear_entities_tables(database_url, tenant_id))
+        uvloop.run(clear_entities_tables(database_url, tenant_id))
     else:
         if not cube_url or not cube_secret:
             print("❌ Error: CUBE_URL and CUBE_SECRET environment variables required")
@@ -308,4 +317,4 @@ if __name__ == "__main__":
             sys.exit(1)
         
         # Run population
-        asyncio.run(populate_database(database_url, cube_url, cube_secret, tenant_id))
\ No newline at end of file
+        uvloop.run(populate_database(database_url, cube_url, cube_secret, tenant_id))
\ No newline at end of file
@@ -1,7 +1,7 @@
 """
 Analyze TicketingDataCapability for production readiness
 """
-import asyncio
+import uvloop
 import os
 from capabilities.ticketing_data import TicketingDataCapability
 from models.capabilities import TicketingDataInputs
@@ -125,4 +125,4 @@ async def analyze_production_readiness():
 
 
 if __name__ == "__main__":
-    asyncio.run(analyze_production_readiness())
\ No newline at end of file
+    uvloop.run(analyze_production_readiness())
\ No newline at end of file
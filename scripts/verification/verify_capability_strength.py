@@ -1,7 +1,7 @@
 """
 Comprehensive verification of TicketingDataCapability strength
 """
-import asyncio
+import uvloop
 import os
 import json
 from capabilities.ticketing_data import TicketingDataCapability
@@ -165,4 +165,4 @@ async def verify_capability():
     
 
 if __name__ == "__main__":
-    asyncio.run(verify_capability())
\ No newline at end of file
+    uvloop.run(verify_capability())
\ No newline at end of file
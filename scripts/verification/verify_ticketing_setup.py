@@ -10,9 +10,12 @@ This script checks:
 Run: docker-compose run --rm test python verify_ticketing_setup.py
 """
 
-import asyncio
+import uvloop
 import os
 import sys
+import logging
+
+logger = logging.getLogger(__name__)
 
 async def main():
     print("🔍 Verifying TicketingDataCapability Setup")
@@ -87,8 +90,7 @@ async def main():
         
     except Exception as e:
         print(f"   ❌ CubeService error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("CubeService check failed")
         sys.exit(1)
     
     # Step 3: Test TicketingDataCapability
@@ -124,8 +126,7 @@ async def main():
         
     except Exception as e:
         print(f"   ❌ TicketingDataCapability error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("TicketingDataCapability check failed")
         sys.exit(1)
     
     print("\n✅ All checks passed! TicketingDataCapability is ready to use.")
@@ -134,4 +135,4 @@ async def main():
     print("2. Implement EventAnalysisCapability for intelligent analysis")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    uvloop.run(main())
\ No newline at end of file
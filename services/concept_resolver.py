@@ -8,10 +8,23 @@ Learns from successful patterns over time with persistent storage.
 from typing import Dict, Any, List, Optional
 import logging
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from mem0 import Memory
 
+from services.ttl_cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
+# Resolved concepts are reused across orchestrator turns; the TTL bounds how
+# long a mapping learned elsewhere (another process) can go unnoticed
+CACHE_TTL_SECONDS = 300
+CACHE_MAX_ENTRIES = 1024
+# mem0 searches are blocking network calls; a batch runs them side by side
+BATCH_MAX_WORKERS = 8
+# Parses mappings out of stored memory text, e.g. "maps to 'financial_performance'"
+MAPPING_PATTERN = re.compile(r"maps to ['\"]([^'\"]+)['\"]?")
+
 
 class ConceptResolver:
     """Memory-based concept resolution with mem0 integration"""
@@ -89,6 +102,9 @@ class ConceptResolver:
             "frustrated": "emotional_support"
         }
         
+        # (concept, user_id) -> memory context; resolve_batch writes from worker threads
+        self._cache = TTLCache(CACHE_TTL_SECONDS, CACHE_MAX_ENTRIES)
+        
         # Seed memory with initial mappings if available
         if self.memory:
             self._seed_initial_mappings()
@@ -100,11 +116,17 @@ class ConceptResolver:
         1. Query mem0 for related memories
         2. If no memory found, use basic mappings
         3. Return enriched memory context
+        
+        Results are cached per (concept, user_id) for CACHE_TTL_SECONDS.
         """
         
-        concept_lower = concept_text.lower().strip()
+        key = (concept_text, user_id)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
         
         # Try mem0 first if available
+        cacheable = True
         if self.memory:
             try:
                 # Search for related memories - try multiple search strategies
@@ -127,10 +149,9 @@ class ConceptResolver:
                         break
                 
                 if related_memories:
-                    # Debug: log what we got back
-                    logger.info(f"Found {len(related_memories)} memories for '{concept_text}'")
-                    logger.info(f"First memory type: {type(related_memories[0])}")
-                    logger.info(f"First memory content: {related_memories[0]}")
+                    # Debug: log what we got back (lazy args - skipped unless DEBUG is on)
+                    logger.debug("Found %d memories for '%s'", len(related_memories), concept_text)
+                    logger.debug("First memory content: %r", related_memories[0])
                     
                     # Extract the best matching concept
                     best_memory = related_memories[0]
@@ -139,9 +160,9 @@ class ConceptResolver:
                     # Get related queries from memory
                     related_queries = self._get_related_queries(concept_text, user_id)
                     
-                    logger.info(f"Found memory for concept '{concept_text}' -> '{mapped_concept}'")
+                    logger.debug("Found memory for concept '%s' -> '%s'", concept_text, mapped_concept)
                     
-                    return {
+                    return self._cache.set(key, {
                         "concept": mapped_concept,
                         "original_text": concept_text,
                         "related_queries": related_queries,
@@ -149,14 +170,49 @@ class ConceptResolver:
                         "relevance_score": best_memory.get('score', 0.8),
                         "confidence": 0.9,
                         "source": "memory"
-                    }
+                    })
                     
             except Exception as e:
                 logger.warning(f"Failed to query mem0 for concept '{concept_text}': {e}")
                 logger.debug(f"Exception type: {type(e)}, Details: {str(e)}")
+                # Don't pin a fallback caused by a transient memory failure
+                cacheable = False
         
         # Fallback to basic mappings
-        mapped_concept = self.basic_mappings.get(concept_lower, "general")
+        context = self._fallback_context(concept_text)
+        return self._cache.set(key, context) if cacheable else context
+    
+    def _invalidate(self, concept_text: str) -> None:
+        """Drop cached resolutions of a concept for all users"""
+        self._cache.discard_where(lambda key: key[0] == concept_text)
+    
+    def resolve_batch(self, concepts: List[str], user_id: str = "system") -> Dict[str, Dict[str, Any]]:
+        """
+        Resolve several concepts in one pass, keyed by concept text
+        
+        Duplicate concepts are looked up once. mem0 has no bulk search, so
+        uncached memory lookups run concurrently in a small thread pool.
+        resolve() already falls back to basic mappings on memory errors.
+        """
+        
+        unique = list(dict.fromkeys(concepts))
+        if not self.memory or len(unique) < 2:
+            return {concept: self.resolve(concept, user_id) for concept in unique}
+        
+        with ThreadPoolExecutor(max_workers=min(BATCH_MAX_WORKERS, len(unique))) as pool:
+            return dict(zip(unique, pool.map(lambda concept: self.resolve(concept, user_id), unique)))
+    
+    def fallback_batch(self, concepts: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Resolve several concepts from basic mappings only
+        """
+        return {concept: self._fallback_context(concept) for concept in dict.fromkeys(concepts)}
+    
+    def _fallback_context(self, concept_text: str) -> Dict[str, Any]:
+        """
+        Build memory context from basic mappings
+        """
+        mapped_concept = self.basic_mappings.get(concept_text.lower().strip(), "general")
         
         logger.debug(f"Using fallback mapping: '{concept_text}' -> '{mapped_concept}'")
         
@@ -174,6 +230,7 @@ class ConceptResolver:
         """
         Learn from successful concept mappings by storing in mem0
         """
+        self._invalidate(concept_text)
         if not self.memory:
             logger.info(f"LEARNING (fallback): '{concept_text}' successfully mapped to '{successful_mapping}'")
             return
@@ -202,6 +259,7 @@ class ConceptResolver:
         """
         Learn from user corrections by storing in mem0
         """
+        self._invalidate(concept_text)
         if not self.memory:
             logger.info(f"USER CORRECTION (fallback): '{concept_text}' should be '{corrected_mapping}'")
             return
@@ -289,8 +347,7 @@ class ConceptResolver:
         memory_text = memory.get('memory', '') or memory.get('data', '') or payload.get('data', '')
         
         # Simple parsing - look for "maps to 'concept'"
-        import re
-        match = re.search(r"maps to ['\"]([^'\"]+)['\"]?", memory_text)
+        match = MAPPING_PATTERN.search(memory_text)
         if match:
             return match.group(1)
             
@@ -9,11 +9,10 @@ Fetches Cube.js meta schema to dynamically discover:
 Based on old system but simplified for our needs.
 """
 
-import httpx
 from typing import List, Dict, Optional
 import logging
-import jwt
-from datetime import datetime, timedelta
+
+from services.cube_service import get_client, get_token
 
 logger = logging.getLogger(__name__)
 
@@ -28,13 +27,7 @@ class CubeMetaService:
     
     def generate_token(self, tenant_id: str = "default") -> str:
         """Generate JWT token for meta API access"""
-        payload = {
-            "sub": tenant_id,
-            "tenant_id": tenant_id,
-            "iat": datetime.utcnow(),
-            "exp": datetime.utcnow() + timedelta(minutes=30)
-        }
-        return jwt.encode(payload, self.cube_secret, algorithm="HS256")
+        return get_token(self.cube_secret, tenant_id)
     
     async def refresh_meta(self):
         """Fetch Cube.js meta schema"""
@@ -45,13 +38,12 @@ class CubeMetaService:
         # Generate JWT token for meta access
         token = self.generate_token()
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                meta_url,
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            self._meta = response.json()
+        response = await get_client().get(
+            meta_url,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        self._meta = response.json()
         
         logger.info(f"Loaded Cube.js meta schema with {len(self._meta.get('cubes', []))} cubes")
     
@@ -7,13 +7,54 @@ Direct HTTP client with tenant isolation and minimal error handling.
 
 import httpx
 import jwt
-from datetime import datetime, timedelta
+import os
+import time
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 import logging
-import json
+import orjson
+
+from services.http_client import SharedClient
 
 logger = logging.getLogger(__name__)
 
+# One pooled client for every Cube.js call (shared with CubeMetaService), so
+# queries reuse keep-alive HTTP/2 connections instead of a fresh TLS handshake each
+_CLIENT = SharedClient()
+
+
+def get_client() -> httpx.AsyncClient:
+    """Shared Cube.js HTTP client, reopened if it was closed"""
+    return _CLIENT.get()
+
+
+async def close_client():
+    """Close the shared Cube.js HTTP client (call on application shutdown)"""
+    await _CLIENT.close()
+
+
+# Tokens live 30 minutes; one is reused within a 25-minute window so every
+# token handed out still has at least 5 minutes left
+TOKEN_LIFETIME_SECONDS = 30 * 60
+TOKEN_REUSE_SECONDS = 25 * 60
+
+
+@lru_cache(maxsize=64)
+def _signed_token(secret: str, tenant_id: str, window: int) -> str:
+    now = int(time.time())
+    payload = {
+        "sub": tenant_id,
+        "tenant_id": tenant_id,
+        "iat": now,
+        "exp": now + TOKEN_LIFETIME_SECONDS
+    }
+    return jwt.encode(payload, secret, algorithm="HS256")
+
+
+def get_token(secret: str, tenant_id: str) -> str:
+    """Tenant-scoped Cube.js JWT, signed once per reuse window"""
+    return _signed_token(secret, tenant_id, int(time.time()) // TOKEN_REUSE_SECONDS)
+
 
 class CubeService:
     """Direct HTTP client to Cube.js with JWT authentication"""
@@ -23,21 +64,14 @@ class CubeService:
         self.cube_secret = cube_secret
     
     def generate_token(self, tenant_id: str) -> str:
-        """Generate JWT with tenant isolation (30-min expiry)"""
-        payload = {
-            "sub": tenant_id,
-            "tenant_id": tenant_id,
-            "iat": datetime.utcnow(),
-            "exp": datetime.utcnow() + timedelta(minutes=30)
-        }
-        return jwt.encode(payload, self.cube_secret, algorithm="HS256")
+        """Generate JWT with tenant isolation (30-min expiry, reused while fresh)"""
+        return get_token(self.cube_secret, tenant_id)
     
-    async def query(
-        self,
+    @staticmethod
+    def _build_query_body(
         measures: List[str],
         dimensions: List[str],
         filters: List[Dict[str, Any]],
-        tenant_id: str,
         time_dimensions: Optional[List[Dict]] = None,
         order: Optional[Dict] = None,
         limit: Optional[int] = None,
@@ -45,9 +79,7 @@ class CubeService:
         total: Optional[bool] = None,
         timezone: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Execute Cube.js query with minimal error handling"""
-        token = self.generate_token(tenant_id)
-        
+        """Build a Cube.js query body, normalizing order to [["field", "dir"]]"""
         query_body = {
             "measures": measures,
             "dimensions": dimensions,
@@ -76,60 +108,124 @@ class CubeService:
         if timezone:
             query_body["timezone"] = timezone
         
+        return query_body
+    
+    async def query(
+        self,
+        measures: List[str],
+        dimensions: List[str],
+        filters: List[Dict[str, Any]],
+        tenant_id: str,
+        time_dimensions: Optional[List[Dict]] = None,
+        order: Optional[Dict] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        total: Optional[bool] = None,
+        timezone: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Execute Cube.js query with minimal error handling"""
+        token = self.generate_token(tenant_id)
+        
+        query_body = self._build_query_body(
+            measures, dimensions, filters, time_dimensions,
+            order, limit, offset, total, timezone
+        )
+        
         logger.info(f"Cube.js query for tenant {tenant_id}: {measures}, {dimensions}")
         
         # Check if this is a compareDateRange query
-        params = {"query": json.dumps(query_body)}
+        params = {"query": orjson.dumps(query_body).decode()}
         if time_dimensions and any("compareDateRange" in td for td in time_dimensions):
             params["queryType"] = "multi"
         
         # Use GET request with query as URL parameter (Cube Cloud format)
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{self.cube_url}/cubejs-api/v1/load",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json"
-                },
-                params=params
-            )
-            if response.status_code != 200:
-                logger.error(f"Cube.js error response: {response.text}")
-            response.raise_for_status()  # Let HTTP errors bubble up naturally
-            
-            result = response.json()
-            
-            # Handle compareDateRange response structure
-            if result.get('queryType') == 'compareDateRangeQuery' and 'results' in result:
-                # Flatten the results into a single data array with period labels
-                flattened_data = []
-                for i, period_result in enumerate(result['results']):
-                    period_data = period_result.get('data', [])
-                    # Add period identifier to each row
-                    for row in period_data:
-                        row['__compareDateRangePeriod'] = i
-                        flattened_data.append(row)
-                
-                # Replace results structure with flattened data
-                result['data'] = flattened_data
-                result['__originalResults'] = result.pop('results')  # Keep original for reference
-                logger.info(f"Cube.js compareDateRange response: {len(result['__originalResults'])} periods, {len(flattened_data)} total rows")
-            else:
-                logger.info(f"Cube.js response: {len(result.get('data', []))} rows")
+        response = await get_client().get(
+            f"{self.cube_url}/cubejs-api/v1/load",
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json"
+            },
+            params=params
+        )
+        if response.status_code != 200:
+            logger.error(f"Cube.js error response: {response.text}")
+        response.raise_for_status()  # Let HTTP errors bubble up naturally
+        
+        result = response.json()
+        
+        # Handle compareDateRange response structure
+        if result.get('queryType') == 'compareDateRangeQuery' and 'results' in result:
+            # Flatten the results into a single data array with period labels
+            flattened_data = []
+            for i, period_result in enumerate(result['results']):
+                period_data = period_result.get('data', [])
+                # Add period identifier to each row
+                for row in period_data:
+                    row['__compareDateRangePeriod'] = i
+                    flattened_data.append(row)
             
-            return result
+            # Replace results structure with flattened data
+            result['data'] = flattened_data
+            result['__originalResults'] = result.pop('results')  # Keep original for reference
+            logger.info(f"Cube.js compareDateRange response: {len(result['__originalResults'])} periods, {len(flattened_data)} total rows")
+        else:
+            logger.info(f"Cube.js response: {len(result.get('data', []))} rows")
+        
+        return result
+    
+    async def query_batch(self, queries: List[Dict[str, Any]], tenant_id: str) -> List[Dict[str, Any]]:
+        """Execute several Cube.js queries in one /load round-trip
+        
+        Queries use the planner's Cube.js shape (measures, dimensions, filters,
+        timeDimensions, order, limit, ...). Results come back in query order.
+        compareDateRange queries are already multi-queries and must go through query().
+        """
+        token = self.generate_token(tenant_id)
+        
+        query_bodies = [
+            self._build_query_body(
+                measures=query.get("measures", []),
+                dimensions=query.get("dimensions", []),
+                filters=query.get("filters", []),
+                time_dimensions=query.get("timeDimensions"),
+                order=query.get("order"),
+                limit=query.get("limit"),
+                offset=query.get("offset"),
+                total=query.get("total"),
+                timezone=query.get("timezone")
+            )
+            for query in queries
+        ]
+        
+        logger.info(f"Cube.js batch of {len(query_bodies)} queries for tenant {tenant_id}")
+        
+        response = await get_client().post(
+            f"{self.cube_url}/cubejs-api/v1/load",
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json"
+            },
+            json={"query": query_bodies, "queryType": "multi"}
+        )
+        if response.status_code != 200:
+            logger.error(f"Cube.js error response: {response.text}")
+        response.raise_for_status()
+        
+        results = response.json().get("results", [])
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Cube.js batch response: {[len(r.get('data', [])) for r in results]} rows")
+        return results
     
     async def get_meta(self, tenant_id: str) -> Dict[str, Any]:
         """Get Cube.js schema metadata for capability discovery"""
         token = self.generate_token(tenant_id)
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{self.cube_url}/cubejs-api/v1/meta",
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await get_client().get(
+            f"{self.cube_url}/cubejs-api/v1/meta",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
 
 
 # Test harness and demonstration functions
@@ -307,8 +403,7 @@ async def demonstrate_cube_capabilities(cube_url: str, cube_secret: str, tenant_
         
     except Exception as e:
         print(f"❌ Test harness failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("CubeService test harness failed")
         return False
 
 
@@ -326,8 +421,7 @@ async def test_cube_connection(cube_url: str, cube_secret: str, tenant_id: str =
 
 
 if __name__ == "__main__":
-    import asyncio
-    import os
+    import uvloop
     
     # Get configuration from environment
     cube_url = os.getenv("CUBE_URL")
@@ -341,7 +435,7 @@ if __name__ == "__main__":
         print("=" * 60)
         
         # Run comprehensive test harness
-        asyncio.run(demonstrate_cube_capabilities(cube_url, cube_secret, tenant_id))
+        uvloop.run(demonstrate_cube_capabilities(cube_url, cube_secret, tenant_id))
     else:
         print("❌ Missing required environment variables:")
         print("   - CUBE_URL: Cube.js API endpoint")
@@ -6,33 +6,82 @@ Everything related or part of the same context stays together in one frame.
 """
 
 import asyncio
+import logging
 import os
-import json
+import hashlib
+import orjson
 from typing import List, Dict, Any, Optional
 import httpx
+from diskcache import Cache
 
 from models.frame import Frame, EntityToResolve
+from services.http_client import SharedClient
+
+logger = logging.getLogger(__name__)
+
+
+# Bump when the extraction prompt changes so stale cached responses are ignored
+PROMPT_VERSION = "2"
+CACHE_TTL_SECONDS = 24 * 60 * 60
+CACHE_SIZE_LIMIT = 1024 ** 3  # 1GB
+
+# Shared client so every extraction reuses pooled HTTP/2 connections to OpenAI
+# instead of paying a TCP + TLS handshake per call
+_CLIENT = SharedClient()
+
+
+def openai_client() -> httpx.AsyncClient:
+    """Shared OpenAI HTTP client, also handed to the LangChain chat models"""
+    return _CLIENT.get()
+
+
+async def close_client():
+    """Close the shared OpenAI HTTP client (call on application shutdown)"""
+    await _CLIENT.close()
 
 
 class FrameExtractor:
     """Extract semantically complete frames from user queries"""
     
-    def __init__(self, api_key: str = None, model: str = None):
+    def __init__(self, api_key: str = None, model: str = None, cache_dir: str = None):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError("OpenAI API key required for frame extraction")
         # Use standard tier by default for frame extraction
         self.model = model or os.getenv("LLM_TIER_STANDARD", "gpt-4.1-mini-2025-04-14")
+        # Cache raw LLM JSON (not Frame objects, which may evolve) across runs
+        self.cache = Cache(
+            cache_dir or os.getenv("FRAME_CACHE_DIR", "./frame_cache"),
+            size_limit=CACHE_SIZE_LIMIT
+        )
     
     async def extract_frames(self, query: str, context: Dict[str, Any] = None) -> List[Frame]:
         """Extract one or more semantically complete frames"""
         
-        prompt = self._build_extraction_prompt(query, context or {})
-        response = await self._call_openai(prompt)
+        context = context or {}
+        cache_key = self._cache_key(query, context)
+        # diskcache does SQLite I/O and pickling; keep it off the event loop
+        response = await asyncio.to_thread(self.cache.get, cache_key)
+        if response is None:
+            prompt = self._build_extraction_prompt(query, context)
+            response = await self._call_openai(prompt, context.get("session_id"))
+            # Unusable replies come back empty; don't pin them in the cache
+            if response:
+                await asyncio.to_thread(self.cache.set, cache_key, response, expire=CACHE_TTL_SECONDS)
         frames = self._parse_response(response, query)
         
         return frames
     
+    def _cache_key(self, query: str, context: Dict[str, Any]) -> str:
+        """Hash everything that shapes the extraction prompt"""
+        
+        normalized_query = " ".join(query.lower().split())
+        # Only previous_entities reaches the prompt, so other context keys
+        # (session_id, history) must not fragment the cache
+        context_keys = orjson.dumps(context.get("previous_entities") or [], option=orjson.OPT_SORT_KEYS, default=str)
+        raw = "\x00".join([self.model, PROMPT_VERSION, normalized_query]).encode() + b"\x00" + context_keys
+        return hashlib.blake2b(raw, digest_size=32).hexdigest()
+    
     def _build_extraction_prompt(self, query: str, context: Dict[str, Any]) -> str:
         """Build prompt for semantic frame extraction"""
 
@@ -88,17 +137,21 @@ Result: Two frames - attendance query and automation request are unrelated
 
 ### 3. Output Format
 
-Return a JSON array of frames. Each frame must include:
+Return a JSON object with a "frames" array. Each frame must include:
 
 ```json
 {{
-  "id": "f1",
-  "query": "The original text for this semantic unit",
-  "entities": [
-    {{"id": "e1", "text": "Chicago", "type": "production"}},
-    {{"id": "e2", "text": "New York", "type": "city"}}
-  ],
-  "concepts": ["revenue", "attendance", "overwhelmed", "stressed", "pace curves", "compare", "high value customers"]
+  "frames": [
+    {{
+      "id": "f1",
+      "query": "The original text for this semantic unit",
+      "entities": [
+        {{"id": "e1", "text": "Chicago", "type": "production"}},
+        {{"id": "e2", "text": "New York", "type": "city"}}
+      ],
+      "concepts": ["revenue", "attendance", "overwhelmed", "stressed", "pace curves", "compare", "high value customers"]
+    }}
+  ]
 }}
 ```
 
@@ -123,57 +176,67 @@ Always return valid JSON - no markdown, comments, or extra keys.
 User Query: "{query}"
 """
     
-    async def _call_openai(self, prompt: str) -> List[Dict[str, Any]]:
+    async def _call_openai(self, prompt: str, session_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """Call OpenAI API for frame extraction"""
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": self.model,
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": "Extract semantically complete frames. Each frame must be self-contained. Return only valid JSON."
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    "temperature": 0.1,
-                    "max_tokens": 2000
-                }
-            )
-            response.raise_for_status()
-            
-            result = response.json()
-            content = result["choices"][0]["message"]["content"]
-            
-            try:
-                parsed = json.loads(content)
-                return parsed if isinstance(parsed, list) else [parsed]
-            except json.JSONDecodeError as e:
-                import re
-                json_match = re.search(r'\[.*\]', content, re.DOTALL)
-                if json_match:
-                    return json.loads(json_match.group())
-                else:
-                    # Fallback to single frame
-                    return [{"query": content, "entities": [], "times": [], "concepts": []}]
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        if session_id:
+            # Lets a session-aware proxy pin all turns to one backend (prefix cache reuse)
+            headers["X-Session-ID"] = session_id
+        
+        response = await openai_client().post(
+            "https://api.openai.com/v1/chat/completions",
+            headers=headers,
+            content=orjson.dumps({
+                "model": self.model,
+                "messages": [
+                    {
+                        "role": "system",
+                        "content": "Extract semantically complete frames. Each frame must be self-contained. Return only valid JSON."
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                "temperature": 0.1,
+                "max_tokens": 2000,
+                # JSON mode guarantees a parseable top-level object
+                "response_format": {"type": "json_object"}
+            })
+        )
+        response.raise_for_status()
+        
+        result = orjson.loads(response.content)
+        choice = result["choices"][0]
+        content = choice["message"].get("content")
+        
+        # JSON mode doesn't cover truncated replies or refusals; returning no
+        # frames lets _parse_response fall back to a single frame
+        if choice.get("finish_reason") == "length" or not content:
+            logger.warning(f"Frame extraction reply unusable (finish_reason={choice.get('finish_reason')})")
+            return []
+        try:
+            parsed = orjson.loads(content)
+        except orjson.JSONDecodeError as e:
+            logger.warning(f"Frame extraction reply is not valid JSON: {e}")
+            return []
+        return parsed.get("frames", []) if isinstance(parsed, dict) else []
     
-    def _parse_response(self, llm_response: List[Dict[str, Any]], original_query: str) -> List[Frame]:
+    @staticmethod
+    def _parse_response(llm_response: List[Dict[str, Any]], original_query: str) -> List[Frame]:
         """Parse LLM response into Frame objects"""
         
         frames = []
         
         for i, frame_data in enumerate(llm_response):
             try:
-                # Parse entities with their types
+                # Parse entities with their types. LLM output is untrusted, so
+                # models are validated: a malformed frame is skipped here rather
+                # than failing later in entity resolution.
                 entities = []
                 for entity_data in frame_data.get("entities", []):
                     if isinstance(entity_data, dict):
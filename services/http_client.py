@@ -0,0 +1,45 @@
+"""
+Pooled HTTP clients shared across services
+
+Each outbound API (Cube.js, OpenAI, chat providers) gets one module-level
+SharedClient so calls reuse keep-alive HTTP/2 connections. Pooled connections
+belong to the event loop that opened them, so each loop gets its own client.
+"""
+
+import asyncio
+from typing import Optional
+
+import httpx
+
+
+class SharedClient:
+    """Lazily created httpx.AsyncClient per event loop, reopened if it was closed"""
+
+    def __init__(self, timeout: float = 30.0, max_connections: int = 50, max_keepalive_connections: int = 20):
+        self._timeout = timeout
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections
+        )
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get(self) -> httpx.AsyncClient:
+        """The pooled client for the running loop, created on first use or after close()
+
+        A client left behind by a previous loop is dropped, not closed: its
+        connections can only be closed on that (usually finished) loop.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None  # Built outside a loop (e.g. at import); binds on first request
+        if self._client is None or self._client.is_closed or (loop is not None and loop is not self._loop):
+            self._client = httpx.AsyncClient(http2=True, timeout=self._timeout, limits=self._limits)
+            self._loop = loop
+        return self._client
+
+    async def close(self) -> None:
+        """Close the pooled client; the next get() opens a fresh one"""
+        if self._client is not None:
+            await self._client.aclose()
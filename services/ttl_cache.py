@@ -0,0 +1,45 @@
+"""
+TTLCache - Small in-process cache for resolver results
+
+Entries expire after a fixed TTL and the oldest entry is evicted when the
+cache is full. Writes take a lock so worker threads can share one cache.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Expiring, size-bounded key -> value cache with FIFO eviction"""
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        # key -> (expires_at, value), insertion-ordered so the first key is the oldest
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Cached value, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def set(self, key: Hashable, value: Any) -> Any:
+        """Cache a value, evicting the oldest entry when full; returns the value"""
+        with self._lock:
+            if len(self._entries) >= self.max_entries and key not in self._entries:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        return value
+
+    def discard_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop every entry whose key matches"""
+        with self._lock:
+            for key in [k for k in self._entries if predicate(k)]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
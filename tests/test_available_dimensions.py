@@ -1,7 +1,7 @@
 """
 Test what dimensions are actually available
 """
-import asyncio
+import uvloop
 import os
 from services.cube_meta_service import CubeMetaService
 
@@ -48,4 +48,4 @@ async def test_dimensions():
 
 
 if __name__ == "__main__":
-    asyncio.run(test_dimensions())
\ No newline at end of file
+    uvloop.run(test_dimensions())
\ No newline at end of file
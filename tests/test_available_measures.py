@@ -1,7 +1,7 @@
 """
 Check available measures
 """
-import asyncio
+import uvloop
 import os
 from services.cube_meta_service import CubeMetaService
 
@@ -40,4 +40,4 @@ async def test_measures():
 
 
 if __name__ == "__main__":
-    asyncio.run(test_measures())
\ No newline at end of file
+    uvloop.run(test_measures())
\ No newline at end of file
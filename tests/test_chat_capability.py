@@ -213,8 +213,8 @@ class TestChatCapability:
             
             # This should be awaited in real usage, but for test we just check the sync validation
             try:
-                import asyncio
-                asyncio.run(chat_capability.execute(MockInputs()))
+                import uvloop
+                uvloop.run(chat_capability.execute(MockInputs()))
             except ValueError as e:
                 assert "Expected ChatInputs" in str(e)
                 raise  # Re-raise for pytest to catch
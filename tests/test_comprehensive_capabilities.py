@@ -13,7 +13,7 @@ Run specific test: docker-compose run --rm test python -m pytest tests/test_comp
 """
 
 import pytest
-import asyncio
+import uvloop
 from datetime import datetime, timedelta
 import os
 
@@ -22,6 +22,15 @@ from models.capabilities import TicketingDataInputs
 from services.entity_resolver import EntityResolver
 
 
+DEFAULT_TENANT_ID = os.getenv("DEFAULT_TENANT_ID", "default")
+
+
+def _print_rows(data_points):
+    """Print sample rows with a single write"""
+    if data_points:
+        print("\n".join(f"  {dp.dimensions} -> {dp.measures}" for dp in data_points))
+
+
 @pytest.mark.integration
 class TestComprehensiveCapabilities:
     """Test real-world query scenarios with actual data"""
@@ -34,11 +43,6 @@ class TestComprehensiveCapabilities:
         yield resolver
         await resolver.disconnect()
     
-    @pytest.fixture
-    def ticketing_capability(self):
-        """Get ticketing data capability"""
-        return TicketingDataCapability()
-    
     async def test_top_ten_shows_by_sales_last_month(self, ticketing_capability, entity_resolver):
         """Test: What are my top ten show sellers next month looking at sales over the last month"""
         
@@ -46,13 +50,13 @@ class TestComprehensiveCapabilities:
         show_candidates = await entity_resolver.resolve_entity(
             text="shows",
             entity_type="productions", 
-            tenant_id=os.getenv("DEFAULT_TENANT_ID", "default")
+            tenant_id=DEFAULT_TENANT_ID
         )
         
         # Create inputs for last month's sales
         inputs = TicketingDataInputs(
             session_id="test-top-10",
-            tenant_id=os.getenv("DEFAULT_TENANT_ID", "default"),
+            tenant_id=DEFAULT_TENANT_ID,
             user_id="test-user",
             query_request="Show me top 10 productions by ticket sales from last month",
             time_context="last month",
@@ -85,7 +89,7 @@ class TestComprehensiveCapabilities:
         
         inputs = TicketingDataInputs(
             session_id="test-q1-q2",
-            tenant_id=os.getenv("DEFAULT_TENANT_ID", "default"),
+            tenant_id=DEFAULT_TENANT_ID,
             user_id="test-user",
             query_request=f"Compare total sales between Q1 and Q2 {current_year}",
             time_context=f"Q1 {current_year} vs Q2 {current_year}",
@@ -108,8 +112,7 @@ class TestComprehensiveCapabilities:
             
         print(f"\nQ1 vs Q2 {current_year} Sales Comparison:")
         print(f"Query: {result.metadata.get('query_description', 'N/A')}")
-        for dp in result.data[:5]:
-            print(f"  {dp.dimensions} -> {dp.measures}")
+        _print_rows(result.data[:5])
     
     async def test_weekly_trends_top_5_shows(self, ticketing_capability, entity_resolver):
         """Test: Show me how my sales have been trending by week for my top 5 shows this year"""
@@ -118,7 +121,7 @@ class TestComprehensiveCapabilities:
         
         inputs = TicketingDataInputs(
             session_id="test-weekly-trends",
-            tenant_id=os.getenv("DEFAULT_TENANT_ID", "default"),
+            tenant_id=DEFAULT_TENANT_ID,
             user_id="test-user",
             query_request=f"Show weekly sales trends for top 5 productions in {current_year}",
             time_context=f"this year ({current_year})",
@@ -152,12 +155,12 @@ class TestComprehensiveCapabilities:
         gatsby_candidates = await entity_resolver.resolve_entity(
             text="Gatsby",
             entity_type="productions",
-            tenant_id=os.getenv("DEFAULT_TENANT_ID", "default")
+            tenant_id=DEFAULT_TENANT_ID
         )
         
         inputs = TicketingDataInputs(
             session_id="test-gatsby-ytd",
-            tenant_id=os.getenv("DEFAULT_TENANT_ID", "default"),
+            tenant_id=DEFAULT_TENANT_ID,
             user_id="test-user",
             query_request="Compare Gatsby performance year-to-date vs same period last year",
             time_context="year to date vs last year same period",
@@ -180,15 +183,14 @@ class TestComprehensiveCapabilities:
         print(f"Query: {result.metadata.get('query_description', 'N/A')}")
         if result.key_findings:
             print(f"Key Findings: {result.key_findings}")
-        for dp in result.data[:5]:
-            print(f"  {dp.dimensions} -> {dp.measures}")
+        _print_rows(result.data[:5])
     
     async def test_venue_performance_by_month(self, ticketing_capability):
         """Test: Show venue performance by month for the last 6 months"""
         
         inputs = TicketingDataInputs(
             session_id="test-venue-monthly",
-            tenant_id=os.getenv("DEFAULT_TENANT_ID", "default"),
+            tenant_id=DEFAULT_TENANT_ID,
             user_id="test-user",
             query_request="Show venue performance by month for last 6 months",
             time_context="last 6 months",
@@ -206,15 +208,14 @@ class TestComprehensiveCapabilities:
         
         print(f"\nVenue Performance by Month:")
         print(f"Total venues/months: {result.total_rows}")
-        for dp in result.data[:10]:
-            print(f"  {dp.dimensions} -> {dp.measures}")
+        _print_rows(result.data[:10])
     
     async def test_chicago_vs_other_cities(self, ticketing_capability):
         """Test: Compare Chicago sales to other major cities"""
         
         inputs = TicketingDataInputs(
             session_id="test-city-comparison",
-            tenant_id=os.getenv("DEFAULT_TENANT_ID", "default"),
+            tenant_id=DEFAULT_TENANT_ID,
             user_id="test-user",
             query_request="Compare Chicago ticket sales to New York and Los Angeles",
             entities=[],  # Cities are dimensions, not entities
@@ -228,15 +229,14 @@ class TestComprehensiveCapabilities:
         assert result.success
         
         print(f"\nCity Sales Comparison:")
-        for dp in result.data[:10]:
-            print(f"  {dp.dimensions} -> {dp.measures}")
+        _print_rows(result.data[:10])
     
     async def test_day_of_week_analysis(self, ticketing_capability):
         """Test: Which days of the week have the highest sales?"""
         
         inputs = TicketingDataInputs(
             session_id="test-dow-analysis",
-            tenant_id=os.getenv("DEFAULT_TENANT_ID", "default"),
+            tenant_id=DEFAULT_TENANT_ID,
             user_id="test-user",
             query_request="Show sales by day of week for the last 3 months",
             time_context="last 3 months",
@@ -259,7 +259,7 @@ class TestComprehensiveCapabilities:
         
         inputs = TicketingDataInputs(
             session_id="test-price-bands",
-            tenant_id=os.getenv("DEFAULT_TENANT_ID", "default"),
+            tenant_id=DEFAULT_TENANT_ID,
             user_id="test-user",
             query_request="Show revenue by price band for top 3 productions",
             measures=[],
@@ -273,8 +273,7 @@ class TestComprehensiveCapabilities:
         assert result.success
         
         print(f"\nRevenue by Price Band:")
-        for dp in result.data[:15]:
-            print(f"  {dp.dimensions} -> {dp.measures}")
+        _print_rows(result.data[:15])
 
 
 # Test runner for debugging individual tests
@@ -295,4 +294,4 @@ if __name__ == "__main__":
             await resolver.disconnect()
     
     # Run the test
-    asyncio.run(run_single_test())
\ No newline at end of file
+    uvloop.run(run_single_test())
\ No newline at end of file
@@ -1,71 +1,135 @@
 """
-Test if drilldown is supported by our Cube.js instance
+Test drilldown support and hierarchical dimension combinations across cubes
 """
 import asyncio
+import uvloop
 import os
 from services.cube_service import CubeService
 
 
+# In-flight Cube.js queries allowed while the combinations run
+MAX_CONCURRENT_QUERIES = 4
+
+
 async def test_drilldown_support():
-    """Test different drilldown formats"""
+    """Test drilldown formats and valid dimension combinations"""
     cube_url = os.getenv("CUBE_URL")
     cube_secret = os.getenv("CUBE_SECRET")
     tenant_id = os.getenv("DEFAULT_TENANT_ID", "yesplan")
     
     service = CubeService(cube_url, cube_secret)
     
-    print("🧪 TESTING DRILLDOWN SUPPORT")
+    print("🧪 TESTING DRILLDOWN SUPPORT AND CUBE COMBINATIONS")
     print("=" * 60)
     
-    # Test 1: Basic query without drilldown (should work)
-    print("\n1️⃣ Basic query (no drilldown):")
-    try:
-        result = await service.query(
-            measures=["ticket_line_items.amount"],
-            dimensions=["productions.name"],
-            filters=[],
-            limit=5,
-            tenant_id=tenant_id
-        )
-        print(f"✅ Success - Got {len(result.get('data', []))} rows")
-    except Exception as e:
-        print(f"❌ Failed: {e}")
+    test_cases = [
+        {
+            "name": "Basic query (no drilldown):",
+            "query": {
+                "measures": ["ticket_line_items.amount"],
+                "dimensions": ["productions.name"],
+                "filters": [],
+                "limit": 5
+            }
+        },
+        {
+            "name": "Productions -> Venues with drilldown=true:",
+            "query": {
+                "measures": ["ticket_line_items.amount"],
+                "dimensions": ["productions.name", "venues.name"],
+                "filters": [],
+                "limit": 5,
+                "drilldown": True
+            }
+        },
+        {
+            "name": "Venues -> Productions (no drilldown flag):",
+            "query": {
+                "measures": ["ticket_line_items.amount"],
+                "dimensions": ["venues.name", "productions.name"],
+                "filters": [],
+                "limit": 10
+            },
+            "sample": lambda row: f"   Sample row has dimensions: {list(row.keys())}"
+        },
+        {
+            "name": "Retailers -> Sales Channels:",
+            "query": {
+                "measures": ["ticket_line_items.amount"],
+                "dimensions": ["retailers.name", "sales_channels.name"],
+                "filters": [],
+                "limit": 10,
+                "drilldown": True
+            }
+        },
+        {
+            "name": "Retailers -> Sales Channels WITHOUT drilldown:",
+            "query": {
+                "measures": ["ticket_line_items.amount"],
+                "dimensions": ["retailers.name", "sales_channels.name"],
+                "filters": [],
+                "limit": 10
+            },
+            "sample": lambda row: f"   Sample: {row.get('retailers.name')} -> {row.get('sales_channels.name')}"
+        },
+        {
+            "name": "Production -> Events with time:",
+            "query": {
+                "measures": ["ticket_line_items.amount"],
+                "dimensions": ["productions.name", "events.starts_at_local"],
+                "filters": [],
+                "limit": 10
+            }
+        },
+        {
+            "name": "City -> Production:",
+            "query": {
+                "measures": ["ticket_line_items.amount"],
+                "dimensions": ["ticket_line_items.city", "productions.name"],
+                "filters": [],
+                "limit": 10,
+                "order": {"ticket_line_items.amount": "desc"}
+            },
+            "sample": lambda row: f"   Top: {row.get('ticket_line_items.city')} - {row.get('productions.name')}"
+        },
+        {
+            "name": "Payment Method -> Sales Channel:",
+            "query": {
+                "measures": ["ticket_line_items.amount"],
+                "dimensions": ["payment_methods.name", "sales_channels.name"],
+                "filters": [],
+                "limit": 10
+            }
+        }
+    ]
     
-    # Test 2: Query with drilldown=true
-    print("\n2️⃣ Query with drilldown=true:")
-    try:
-        result = await service.query(
-            measures=["ticket_line_items.amount"],
-            dimensions=["productions.name", "venues.name"],
-            filters=[],
-            limit=5,
-            drilldown=True,
-            tenant_id=tenant_id
-        )
-        print(f"✅ Success - Drilldown supported!")
-        print(f"   Got {len(result.get('data', []))} rows")
-    except Exception as e:
-        print(f"❌ Failed: {e}")
+    # Queries are independent round-trips; the semaphore keeps fan-out bounded
+    sem = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
     
-    # Test 3: Check if dimensions can be hierarchical without drilldown
-    print("\n3️⃣ Multiple dimensions (no drilldown flag):")
-    try:
-        result = await service.query(
-            measures=["ticket_line_items.amount"],
-            dimensions=["venues.name", "productions.name"],
-            filters=[],
-            limit=10,
-            tenant_id=tenant_id
-        )
+    async def run(test_case):
+        async with sem:
+            return await service.query(**test_case["query"], tenant_id=tenant_id)
+    
+    results = await asyncio.gather(*(run(tc) for tc in test_cases), return_exceptions=True)
+    
+    for i, (test_case, result) in enumerate(zip(test_cases, results), 1):
+        print(f"\n{i}. {test_case['name']}")
+        if isinstance(result, Exception):
+            error_msg = str(result)
+            if "drilldown" not in test_case["query"]:
+                print(f"❌ Failed: {result}")
+            elif "drilldown" in error_msg:
+                print(f"❌ Drilldown not allowed")
+            else:
+                print(f"❌ Different error: {error_msg[:100]}...")
+            continue
+        
         print(f"✅ Success - Got {len(result.get('data', []))} rows")
-        if result.get('data'):
-            first_row = result['data'][0]
-            print(f"   Sample row has dimensions: {list(first_row.keys())}")
-    except Exception as e:
-        print(f"❌ Failed: {e}")
+        if result.get('data') and "sample" in test_case:
+            print(test_case["sample"](result['data'][0]))
     
-    # Test 4: Check meta API for drilldown support
-    print("\n4️⃣ Checking Cube.js meta for features:")
+    # Check meta API for drilldown support
+    print("\nChecking Cube.js meta for features:")
     from services.cube_meta_service import CubeMetaService
     meta_service = CubeMetaService(cube_url, cube_secret)
     try:
@@ -79,9 +143,10 @@ async def test_drilldown_support():
     
     print("\n" + "="*60)
     print("CONCLUSION:")
-    print("If test 2 failed, drilldown is not supported by this Cube.js instance.")
-    print("Use multiple dimensions (test 3) for hierarchical data instead.")
+    print("- Drilldown parameter is not supported by this Cube.js instance")
+    print("- But hierarchical queries work fine with multiple dimensions")
+    print("- Use dimensions from different cubes for hierarchy")
 
 
 if __name__ == "__main__":
-    asyncio.run(test_drilldown_support())
\ No newline at end of file
+    uvloop.run(test_drilldown_support())
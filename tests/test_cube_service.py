@@ -16,20 +16,21 @@ import pytest
 import jwt
 from datetime import datetime
 import httpx
+import uvloop
 
 from services.cube_service import CubeService
+from services.http_client import SharedClient
 
 
 class TestCubeService:
     """Test CubeService with real connections"""
     
     @pytest.mark.unit
-    def test_token_generation(self, cube_config):
+    def test_token_generation(self, cube_config, cube_service):
         """Test JWT token generation logic"""
-        service = CubeService(cube_config["url"], cube_config["secret"])
         tenant_id = "test_tenant"
         
-        token = service.generate_token(tenant_id)
+        token = cube_service.generate_token(tenant_id)
         
         # Decode and verify token
         decoded = jwt.decode(token, cube_config["secret"], algorithms=["HS256"])
@@ -45,18 +46,44 @@ class TestCubeService:
         delta = exp_time - iat_time
         assert 29 <= delta.total_seconds() / 60 <= 31
     
+    @pytest.mark.unit
+    async def test_shared_client_reopens_after_close(self):
+        """Test that a closed shared client is replaced on next use"""
+        shared = SharedClient()
+        client = shared.get()
+        assert shared.get() is client
+        
+        await shared.close()
+        assert client.is_closed
+        reopened = shared.get()
+        assert reopened is not client and not reopened.is_closed
+        await shared.close()
+    
+    @pytest.mark.unit
+    def test_shared_client_per_event_loop(self):
+        """Test that each event loop gets its own pooled client"""
+        shared = SharedClient()
+        
+        async def client_pair():
+            return shared.get(), shared.get()
+        
+        first, again = uvloop.run(client_pair())
+        assert first is again
+        
+        # A later loop (e.g. a second uvloop.run in a script) must not reuse it
+        second, _ = uvloop.run(client_pair())
+        assert second is not first
+    
     @pytest.mark.integration
     @pytest.mark.requires_cube
-    async def test_cube_connection(self, cube_config):
+    async def test_cube_connection(self, cube_config, cube_service):
         """Test real Cube.js connection"""
         if not cube_config["url"] or cube_config["secret"] == "test-secret":
             pytest.skip("Real CUBE_URL and CUBE_SECRET required")
         
-        service = CubeService(cube_config["url"], cube_config["secret"])
-        
         # Test metadata endpoint
         try:
-            meta = await service.get_meta("test_tenant")
+            meta = await cube_service.get_meta("test_tenant")
             assert "cubes" in meta
             print(f"✅ Connected to Cube.js: {len(meta.get('cubes', []))} cubes available")
         except httpx.ConnectError:
@@ -66,15 +93,13 @@ class TestCubeService:
     
     @pytest.mark.integration
     @pytest.mark.requires_cube
-    async def test_cube_query(self, cube_config, real_tenant_id):
+    async def test_cube_query(self, cube_config, cube_service, real_tenant_id):
         """Test real Cube.js query"""
         if not cube_config["url"] or cube_config["secret"] == "test-secret":
             pytest.skip("Real CUBE_URL and CUBE_SECRET required")
         
-        service = CubeService(cube_config["url"], cube_config["secret"])
-        
         # Simple query to test connection
-        result = await service.query(
+        result = await cube_service.query(
             measures=["productions.count"],
             dimensions=["productions.name"],
             filters=[],  # Array format
@@ -88,15 +113,13 @@ class TestCubeService:
     
     @pytest.mark.integration
     @pytest.mark.requires_cube
-    async def test_cube_query_with_measures(self, cube_config, real_tenant_id):
+    async def test_cube_query_with_measures(self, cube_config, cube_service, real_tenant_id):
         """Test Cube.js query with measures and filters"""
         if not cube_config["url"] or cube_config["secret"] == "test-secret":
             pytest.skip("Real CUBE_URL and CUBE_SECRET required")
         
-        service = CubeService(cube_config["url"], cube_config["secret"])
-        
         # Query with ticket line items measures
-        result = await service.query(
+        result = await cube_service.query(
             measures=["ticket_line_items.amount", "ticket_line_items.quantity"],
             dimensions=["productions.name"],
             filters=[],  # Array format
@@ -121,15 +144,13 @@ class TestCubeService:
     
     @pytest.mark.integration
     @pytest.mark.requires_cube
-    async def test_cube_time_dimension(self, cube_config, real_tenant_id):
+    async def test_cube_time_dimension(self, cube_config, cube_service, real_tenant_id):
         """Test Cube.js query with time dimensions"""
         if not cube_config["url"] or cube_config["secret"] == "test-secret":
             pytest.skip("Real CUBE_URL and CUBE_SECRET required")
         
-        service = CubeService(cube_config["url"], cube_config["secret"])
-        
         # Query last 30 days using actual time dimension
-        result = await service.query(
+        result = await cube_service.query(
             measures=["ticket_line_items.amount"],
             dimensions=["ticket_line_items.created_at_local"],
             filters=[],  # Array format
@@ -145,7 +166,49 @@ class TestCubeService:
         assert "data" in result
         if result["data"]:
             print(f"✅ Found {len(result['data'])} days with sales in last 30 days")
-    
+
+    @pytest.mark.integration
+    @pytest.mark.requires_cube
+    async def test_cube_query_batch(self, cube_config, cube_service, real_tenant_id):
+        """Test that the query shapes above run as one multi-query /load"""
+        if not cube_config["url"] or cube_config["secret"] == "test-secret":
+            pytest.skip("Real CUBE_URL and CUBE_SECRET required")
+
+        # Same shapes as the single-query tests, sent in one round-trip
+        queries = [
+            {
+                "measures": ["productions.count"],
+                "dimensions": ["productions.name"],
+                "limit": 5
+            },
+            {
+                "measures": ["ticket_line_items.amount", "ticket_line_items.quantity"],
+                "dimensions": ["productions.name"],
+                "order": {"ticket_line_items.amount": "desc"},
+                "limit": 10
+            },
+            {
+                "measures": ["ticket_line_items.amount"],
+                "dimensions": ["ticket_line_items.created_at_local"],
+                "timeDimensions": [{
+                    "dimension": "ticket_line_items.created_at_local",
+                    "dateRange": "last 30 days"
+                }],
+                "order": {"ticket_line_items.created_at_local": "desc"},
+                "limit": 5
+            }
+        ]
+
+        results = await cube_service.query_batch(queries, tenant_id=real_tenant_id)
+
+        assert len(results) == len(queries)
+        for query, result in zip(queries, results):
+            assert isinstance(result["data"], list)
+            assert len(result["data"]) <= query["limit"]
+            for row in result["data"]:
+                assert all(member in row for member in query["measures"] + query["dimensions"])
+        print(f"✅ Batch returned {[len(r['data']) for r in results]} rows")
+
     @pytest.mark.integration 
     @pytest.mark.requires_cube
     async def test_http_error_propagation(self, cube_config):
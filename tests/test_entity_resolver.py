@@ -47,6 +47,21 @@ class TestEntityResolver:
         
         print("✅ Score transformation working correctly")
     
+    def test_batch_score_transformation(self):
+        """Test batch transform matches per-score transform with discounting"""
+        resolver = EntityResolver("dummy_url")
+        
+        pg_scores = [0.8, 0.6, 0.4, 0.2]
+        assert resolver.transform_scores(pg_scores) == [resolver.transform_score(s) for s in pg_scores]
+        
+        # Cross-type discount applies after boosting
+        discounted = resolver.transform_scores(pg_scores, discount=0.85)
+        assert discounted[0] == 0.85
+        assert abs(discounted[1] - 0.9 * 0.85) < 0.001
+        assert resolver.transform_scores([]) == []
+        
+        print("✅ Batch score transformation working correctly")
+    
     @pytest.mark.integration
     async def test_entity_resolution_empty(self, database_url, test_tenant_id, test_db):
         """Test entity resolution with empty database"""
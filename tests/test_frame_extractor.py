@@ -16,6 +16,7 @@ Run with output: docker-compose run --rm test python -m pytest tests/test_frame_
 
 import asyncio
 import os
+import time
 from typing import List, Dict, Any
 import json
 import pytest
@@ -210,6 +211,10 @@ TEST_QUERIES = [
 ]
 
 
+# Concurrent extraction calls allowed during the full query run
+MAX_CONCURRENT_EXTRACTIONS = 5
+
+
 @pytest.mark.integration
 async def test_frame_extraction():
     """Test frame extraction for all queries"""
@@ -219,20 +224,42 @@ async def test_frame_extraction():
         pytest.skip("OPENAI_API_KEY not set - skipping LLM tests")
     
     extractor = FrameExtractor()
-    results = []
+    # Failures are collected during the run, so the summary needs no second pass
+    failures = []
+    # Rolling latency stats, so no per-query samples are kept
+    latency_total = 0.0
+    latency_max = 0.0
+    
+    # Bound in-flight OpenAI calls instead of pacing queries one at a time
+    limiter = asyncio.Semaphore(MAX_CONCURRENT_EXTRACTIONS)
+    
+    async def extract(query: str):
+        async with limiter:
+            start = time.perf_counter()
+            frames = await extractor.extract_frames(query)
+            return frames, time.perf_counter() - start
     
     print("\n🧪 Testing Frame Extraction with All Test Queries")
     print("=" * 80)
     
-    for test_query in TEST_QUERIES:
+    outcomes = await asyncio.gather(
+        *(extract(test_query.query) for test_query in TEST_QUERIES),
+        return_exceptions=True
+    )
+    
+    for test_query, outcome in zip(TEST_QUERIES, outcomes):
         print(f"\n📝 Query: \"{test_query.query}\"")
         print(f"   Description: {test_query.description}")
         print(f"   Expected frames: {test_query.expected_frames}")
         
         try:
-            frames = await extractor.extract_frames(test_query.query)
+            if isinstance(outcome, Exception):
+                raise outcome
+            frames, elapsed = outcome
+            latency_total += elapsed
+            latency_max = max(latency_max, elapsed)
             
-            print(f"   ✓ Extracted {len(frames)} frame(s)")
+            print(f"   ✓ Extracted {len(frames)} frame(s) in {elapsed:.2f}s")
             
             for i, frame in enumerate(frames, 1):
                 print(f"\n   Frame {i}:")
@@ -247,15 +274,14 @@ async def test_frame_extraction():
             # Check if frame count matches expectation
             if len(frames) == test_query.expected_frames:
                 print(f"   ✅ Frame count matches expectation")
-                results.append((test_query.query, True, ""))
             else:
                 error = f"Expected {test_query.expected_frames} frames, got {len(frames)}"
                 print(f"   ❌ {error}")
-                results.append((test_query.query, False, error))
+                failures.append((test_query.query, error))
                 
         except Exception as e:
             print(f"   ❌ Error: {str(e)}")
-            results.append((test_query.query, False, str(e)))
+            failures.append((test_query.query, str(e)))
         
         print("-" * 60)
     
@@ -264,16 +290,16 @@ async def test_frame_extraction():
     print("📊 Test Summary")
     print("=" * 80)
     
-    passed = sum(1 for _, success, _ in results if success)
-    total = len(results)
+    total = len(TEST_QUERIES)
+    passed = total - len(failures)
     
     print(f"✅ Passed: {passed}/{total} ({passed/total*100:.1f}%)")
+    print(f"⏱️  Extraction latency: mean {latency_total/total:.2f}s, max {latency_max:.2f}s")
     
-    if passed < total:
+    if failures:
         print(f"\n❌ Failed queries:")
-        for query, success, error in results:
-            if not success:
-                print(f"   - \"{query[:50]}...\": {error}")
+        for query, error in failures:
+            print(f"   - \"{query[:50]}...\": {error}")
     
     # Assert for pytest
     assert passed == total, f"Failed {total - passed} out of {total} test queries"
@@ -308,4 +334,20 @@ def test_expected_frame_structures():
     print("- Frame 2: entities=[], times=[], concepts=[] (agent check-in)")
     
     # This test always passes - it's just documentation
-    assert True
\ No newline at end of file
+    assert True
+
+
+@pytest.mark.unit
+def test_malformed_llm_frames_are_skipped():
+    """Test that frames failing validation are dropped before entity resolution"""
+    
+    llm_response = [
+        {"id": "f1", "query": "Revenue for Chicago", "entities": [{"id": "e1", "text": None, "type": "production"}]},
+        {"id": "f2", "query": "Revenue for Gatsby", "entities": [{"id": "e1", "text": "Gatsby", "type": "production"}]}
+    ]
+    
+    # _parse_response doesn't touch the client, so no API key is needed
+    frames = FrameExtractor._parse_response(llm_response, "Revenue for Chicago and Gatsby")
+    
+    assert [frame.id for frame in frames] == ["f2"]
+    assert frames[0].entities[0].text == "Gatsby"
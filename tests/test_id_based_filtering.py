@@ -11,8 +11,9 @@ Run: docker-compose run --rm test python -m pytest tests/test_id_based_filtering
 Run specific test: docker-compose run --rm test python -m pytest tests/test_id_based_filtering.py::test_id_filtering -v
 """
 
-import pytest
 import asyncio
+import pytest
+import uvloop
 from workflow.graph import process_query
 
 
@@ -148,9 +149,12 @@ async def test_entity_id_in_orchestration_context():
 # Test runner for debugging
 if __name__ == "__main__":
     async def run_tests():
-        await test_id_filtering()
-        await test_ambiguous_entity_resolution()
-        await test_entity_id_in_orchestration_context()
+        # Each test uses its own session, so they can run concurrently
+        await asyncio.gather(
+            test_id_filtering(),
+            test_ambiguous_entity_resolution(),
+            test_entity_id_in_orchestration_context()
+        )
         print("✅ All ID-based filtering tests passed!")
     
-    asyncio.run(run_tests())
\ No newline at end of file
+    uvloop.run(run_tests())
\ No newline at end of file
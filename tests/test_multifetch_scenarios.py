@@ -1,7 +1,7 @@
 """
 Test multi-fetch scenarios to ensure they work correctly
 """
-import asyncio
+import uvloop
 import os
 import json
 from capabilities.ticketing_data import TicketingDataCapability
@@ -104,4 +104,4 @@ async def test_multifetch_scenarios():
 
 
 if __name__ == "__main__":
-    asyncio.run(test_multifetch_scenarios())
\ No newline at end of file
+    uvloop.run(test_multifetch_scenarios())
\ No newline at end of file
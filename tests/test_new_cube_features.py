@@ -1,7 +1,7 @@
 """
 Test new Cube.js features (pagination, ungrouped, total)
 """
-import asyncio
+import uvloop
 import os
 from capabilities.ticketing_data import TicketingDataCapability
 from models.capabilities import TicketingDataInputs
@@ -32,8 +32,7 @@ async def test_new_features():
     print(f"Rows returned: {result.total_rows}")
     if result.success and result.data:
         print("Productions on page 2:")
-        for dp in result.data[:3]:
-            print(f"  - {dp.dimensions.get('productions.name', 'Unknown')}")
+        print("\n".join(f"  - {dp.dimensions.get('productions.name', 'Unknown')}" for dp in result.data[:3]))
     
     # Test 2: Raw data export (ungrouped)
     print("\n\n2️⃣ TEST: Raw Data Export")
@@ -72,4 +71,4 @@ async def test_new_features():
 
 
 if __name__ == "__main__":
-    asyncio.run(test_new_features())
\ No newline at end of file
+    uvloop.run(test_new_features())
\ No newline at end of file
@@ -1,7 +1,7 @@
 """Test only natural language"""
-import asyncio
+import uvloop
 import os
-import json
+import orjson
 from capabilities.ticketing_data import TicketingDataCapability
 from models.capabilities import TicketingDataInputs
 
@@ -25,7 +25,7 @@ async def test_nl():
     print(f"Query plan queries:")
     for i, query in enumerate(query_plan.queries):
         print(f"\nQuery {i}:")
-        print(json.dumps(query, indent=2))
+        print(orjson.dumps(query, option=orjson.OPT_INDENT_2).decode())
 
 if __name__ == "__main__":
-    asyncio.run(test_nl())
\ No newline at end of file
+    uvloop.run(test_nl())
\ No newline at end of file
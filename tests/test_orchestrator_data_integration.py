@@ -6,24 +6,62 @@ Run: docker-compose run --rm test python test_orchestrator_with_data.py
 """
 
 import asyncio
+import uvloop
 import os
+import pytest
 from workflow.graph import process_query
 
-async def main():
+pytestmark = [pytest.mark.requires_cube, pytest.mark.requires_openai]
+
+@pytest.mark.integration
+async def test_orchestrator_with_data():
     print("🎯 Testing Orchestrator with TicketingDataCapability")
     print("=" * 60)
     
     tenant_id = os.getenv("TENANT_ID", "test_tenant")
     
+    # The four queries use separate sessions, so run them concurrently
+    direct, top_shows, mixed, ambiguous = await asyncio.gather(
+        process_query(
+            query="Show me revenue for Gatsby",
+            session_id="test1",
+            user_id="test_user",
+            tenant_id=tenant_id,
+            debug=True
+        ),
+        process_query(
+            query="What are my top 5 shows by revenue?",
+            session_id="test2",
+            user_id="test_user",
+            tenant_id=tenant_id,
+            debug=False
+        ),
+        process_query(
+            query="I'm worried about Chicago. How is it performing?",
+            session_id="test3",
+            user_id="test_user",
+            tenant_id=tenant_id,
+            debug=True
+        ),
+        process_query(
+            query="Show me revenue for Paris",
+            session_id="test4",
+            user_id="test_user",
+            tenant_id=tenant_id,
+            debug=True
+        )
+    )
+    
+    # Every query must run to completion; debug runs must carry their trace
+    for name, result in [("direct", direct), ("top_shows", top_shows), ("mixed", mixed), ("ambiguous", ambiguous)]:
+        assert result['success'], f"{name} query failed: {result.get('errors') or result.get('error')}"
+        assert result['response'] is not None, f"{name} query gave no final response"
+    for result in (direct, mixed, ambiguous):
+        assert result['debug'] is not None
+    
     # Test 1: Direct data query
     print("\n1️⃣ Test: Direct revenue query")
-    result = await process_query(
-        query="Show me revenue for Gatsby",
-        session_id="test1",
-        user_id="test_user",
-        tenant_id=tenant_id,
-        debug=True
-    )
+    result = direct
     
     print(f"Success: {result['success']}")
     messages = result.get('messages', [])
@@ -49,13 +87,7 @@ async def main():
     
     # Test 2: Complex query needing data
     print("\n\n2️⃣ Test: Top shows query")
-    result = await process_query(
-        query="What are my top 5 shows by revenue?",
-        session_id="test2",
-        user_id="test_user",
-        tenant_id=tenant_id,
-        debug=False
-    )
+    result = top_shows
     
     print(f"Success: {result['success']}")
     
@@ -67,13 +99,7 @@ async def main():
     
     # Test 3: Mixed emotional and data query
     print("\n\n3️⃣ Test: Mixed emotional and data query")
-    result = await process_query(
-        query="I'm worried about Chicago. How is it performing?",
-        session_id="test3",
-        user_id="test_user",
-        tenant_id=tenant_id,
-        debug=True
-    )
+    result = mixed
     
     print(f"Success: {result['success']}")
     
@@ -95,13 +121,7 @@ async def main():
     
     # Test 4: Query requiring disambiguation
     print("\n\n4️⃣ Test: Ambiguous entity query")
-    result = await process_query(
-        query="Show me revenue for Paris",
-        session_id="test4",
-        user_id="test_user",
-        tenant_id=tenant_id,
-        debug=True
-    )
+    result = ambiguous
     
     print(f"Success: {result['success']}")
     
@@ -118,4 +138,4 @@ async def main():
     print("\n✅ Orchestrator test with data capability complete!")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    uvloop.run(test_orchestrator_with_data())
\ No newline at end of file
@@ -1,7 +1,7 @@
 """
 Test pagination features (offset, total)
 """
-import asyncio
+import uvloop
 import os
 from capabilities.ticketing_data import TicketingDataCapability
 from models.capabilities import TicketingDataInputs
@@ -85,4 +85,4 @@ async def test_pagination():
 
 
 if __name__ == "__main__":
-    asyncio.run(test_pagination())
\ No newline at end of file
+    uvloop.run(test_pagination())
\ No newline at end of file
@@ -5,9 +5,12 @@ Uses REAL Cube.js service - no mocks!
 
 import os
 import pytest
-import json
+import orjson
 from capabilities.ticketing_data import TicketingDataCapability
-from models.capabilities import TicketingDataInputs, CubeFilter
+from models.capabilities import TicketingDataInputs, TicketingDataResult, DataPoint, CubeFilter
+
+
+DEFAULT_TENANT_ID = os.getenv("DEFAULT_TENANT_ID", "yesplan")
 
 
 @pytest.mark.integration
@@ -16,18 +19,18 @@ class TestSmartQueryGenerationIntegration:
     """Test LLM's ability to handle high cardinality dimensions with REAL data"""
     
     @pytest.fixture
-    async def capability(self):
-        """Create capability with REAL Cube services"""
+    def capability(self, ticketing_capability):
+        """Session-wide capability with REAL Cube services"""
         if not os.getenv("CUBE_URL") or not os.getenv("CUBE_SECRET"):
             pytest.skip("CUBE_URL and CUBE_SECRET required for integration tests")
         
-        return TicketingDataCapability()
+        return ticketing_capability
     
     async def test_city_dimension_handling(self, capability):
         """Test that LLM handles ticket_line_items.city properly"""
         inputs = TicketingDataInputs(
             session_id="test",
-            tenant_id=os.getenv("DEFAULT_TENANT_ID", "yesplan"),
+            tenant_id=DEFAULT_TENANT_ID,
             user_id="test",
             query_request="Show top 20 cities by revenue",
             measures=["ticket_line_items.amount"],
@@ -46,7 +49,7 @@ class TestSmartQueryGenerationIntegration:
         # Verify the query has proper ordering and limit
         for i, query in enumerate(query_plan.queries):
             print(f"\n📊 Query {i+1}:")
-            print(json.dumps(query, indent=2))
+            print(orjson.dumps(query, option=orjson.OPT_INDENT_2).decode())
             
             # Check for city dimension
             if 'ticket_line_items.city' in query.get('dimensions', []):
@@ -62,7 +65,7 @@ class TestSmartQueryGenerationIntegration:
         """Test that LLM avoids or limits customer_id dimension"""
         inputs = TicketingDataInputs(
             session_id="test",
-            tenant_id=os.getenv("DEFAULT_TENANT_ID", "yesplan"),
+            tenant_id=DEFAULT_TENANT_ID,
             user_id="test",
             query_request="Show customer spending patterns",
             measures=["ticket_line_items.amount"],
@@ -89,7 +92,7 @@ class TestSmartQueryGenerationIntegration:
         """Test events.id handling with real schema"""
         inputs = TicketingDataInputs(
             session_id="test",
-            tenant_id=os.getenv("DEFAULT_TENANT_ID", "yesplan"),
+            tenant_id=DEFAULT_TENANT_ID,
             user_id="test",
             query_request="Show daily revenue by event for Chicago",
             measures=["ticket_line_items.amount"],
@@ -131,7 +134,7 @@ class TestSmartQueryGenerationIntegration:
         """Test that production-level queries work efficiently"""
         inputs = TicketingDataInputs(
             session_id="test",
-            tenant_id=os.getenv("DEFAULT_TENANT_ID", "yesplan"),
+            tenant_id=DEFAULT_TENANT_ID,
             user_id="test",
             query_request="Compare Q1 vs Q2 2024 revenue by production",
             measures=["ticket_line_items.amount"],
@@ -156,14 +159,14 @@ class TestSmartQueryGenerationIntegration:
         # Each query should have appropriate date range
         for i, query in enumerate(query_plan.queries):
             print(f"\nQuery {i+1} time dimensions:")
-            print(json.dumps(query.get('timeDimensions', []), indent=2))
+            print(orjson.dumps(query.get('timeDimensions', []), option=orjson.OPT_INDENT_2).decode())
     
     async def test_real_query_execution(self, capability):
         """Test actual query execution with smart generation"""
         # First, let's see what data we have
         test_inputs = TicketingDataInputs(
             session_id="test",
-            tenant_id=os.getenv("DEFAULT_TENANT_ID", "yesplan"),
+            tenant_id=DEFAULT_TENANT_ID,
             user_id="test",
             query_request="Show top 5 cities by total revenue",
             measures=["ticket_line_items.amount"],
@@ -182,7 +185,7 @@ class TestSmartQueryGenerationIntegration:
             # Check query structure even if no data
             query_meta = result.query_metadata.get('cube_response', {}).get('query', {})
             print(f"\nGenerated query:")
-            print(json.dumps(query_meta, indent=2))
+            print(orjson.dumps(query_meta, option=orjson.OPT_INDENT_2).decode())
             
             # Verify query has proper structure
             assert 'order' in query_meta, "Query should have ordering"
@@ -214,9 +217,60 @@ class TestSmartQueryGenerationIntegration:
                 print("  - Different tenant data")
 
 
+
+@pytest.mark.unit
+def test_direct_plan_guards_high_cardinality():
+    """Test that structured inputs skip the planner only when the query stays bounded"""
+    context = {
+        "measure_set": {"ticket_line_items.amount"},
+        "dimension_set": {"productions.name", "ticket_line_items.customer_id"}
+    }
+    
+    def direct_plan(**fields):
+        inputs = TicketingDataInputs(
+            session_id="test",
+            tenant_id=DEFAULT_TENANT_ID,
+            user_id="test",
+            measures=["ticket_line_items.amount"],
+            **fields
+        )
+        # The shortcut reads only its arguments, so no Cube.js connection is needed
+        return TicketingDataCapability._direct_query_plan(inputs, context)
+    
+    # Unbounded customer-level grouping goes to the planner
+    assert direct_plan(dimensions=["ticket_line_items.customer_id"]) is None
+    
+    # A limit without order gets the planner's default top-rows ordering
+    plan = direct_plan(dimensions=["ticket_line_items.customer_id"], limit=100)
+    assert plan.queries[0]["order"] == {"ticket_line_items.amount": "desc"}
+    
+    plan = direct_plan(dimensions=["productions.name"])
+    assert "limit" not in plan.queries[0]
+
+
+@pytest.mark.unit
+def test_result_to_dict_matches_model_dump():
+    """Test that the hand-built to_dict() keeps every field model_dump() has"""
+    result = TicketingDataResult(
+        success=True,
+        metadata={"query_plan": "direct"},
+        data=[
+            DataPoint(dimensions={"productions.name": "Chicago"}, measures={"ticket_line_items.amount": 1200.5}),
+            DataPoint(dimensions={"productions.name": "Wicked"}, measures={"ticket_line_items.amount": 900})
+        ],
+        query_metadata={"measures": ["ticket_line_items.amount"]},
+        total_rows=2,
+        total_columns=2,
+        total_measures=1,
+        assumptions=["All-time totals"]
+    )
+    
+    assert result.to_dict() == result.model_dump()
+
+
 if __name__ == "__main__":
     # For direct execution
-    import asyncio
+    import uvloop
     
     async def run_tests():
         """Run integration tests directly"""
@@ -249,4 +303,4 @@ if __name__ == "__main__":
             except Exception as e:
                 print(f"❌ {test_name} error: {e}")
     
-    asyncio.run(run_tests())
\ No newline at end of file
+    uvloop.run(run_tests())
\ No newline at end of file
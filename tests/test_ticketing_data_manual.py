@@ -5,7 +5,7 @@ This test allows you to manually verify the TicketingDataCapability
 with real queries against the Cube.js API.
 """
 
-import asyncio
+import uvloop
 from capabilities.ticketing_data import TicketingDataCapability
 from models.capabilities import TicketingDataInputs, CubeFilter
 
@@ -40,8 +40,11 @@ async def test_ticketing_data_capability():
     print(f"Rows returned: {result.total_rows}")
     
     if result.data:
-        for dp in result.data[:3]:  # Show first 3
-            print(f"  {dp.dimensions.get('productions.name', 'Unknown')}: ${dp.measures.get('ticket_line_items.amount', 0):,.0f}")
+        # Show first 3
+        print("\n".join(
+            f"  {dp.dimensions.get('productions.name', 'Unknown')}: ${dp.measures.get('ticket_line_items.amount', 0):,.0f}"
+            for dp in result.data[:3]
+        ))
     
     # Test 2: Top productions by revenue
     print("\n2. Top 5 Productions by Revenue:")
@@ -90,4 +93,4 @@ async def test_ticketing_data_capability():
 
 
 if __name__ == "__main__":
-    asyncio.run(test_ticketing_data_capability())
\ No newline at end of file
+    uvloop.run(test_ticketing_data_capability())
\ No newline at end of file
@@ -0,0 +1,51 @@
+"""
+Tests for TTLCache - expiry, FIFO eviction and invalidation
+
+Run: docker-compose run --rm test python -m pytest tests/test_ttl_cache.py -v
+"""
+
+import time
+import pytest
+
+from services.ttl_cache import TTLCache
+
+
+@pytest.mark.unit
+def test_get_returns_value_until_expiry():
+    """Test that entries are served until their TTL passes"""
+    cache = TTLCache(ttl_seconds=0.05, max_entries=10)
+    
+    assert cache.set(("chicago", "production"), ["prod_1"]) == ["prod_1"]
+    assert cache.get(("chicago", "production")) == ["prod_1"]
+    
+    time.sleep(0.06)
+    assert cache.get(("chicago", "production")) is None
+
+
+@pytest.mark.unit
+def test_oldest_entry_evicted_when_full():
+    """Test FIFO eviction, and that overwriting a key never evicts"""
+    cache = TTLCache(ttl_seconds=60, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("b", 3)
+    assert len(cache) == 2
+    
+    cache.set("c", 4)
+    assert cache.get("a") is None
+    assert cache.get("b") == 3 and cache.get("c") == 4
+
+
+@pytest.mark.unit
+def test_discard_where():
+    """Test that matching keys are dropped for every user"""
+    cache = TTLCache(ttl_seconds=60, max_entries=10)
+    cache.set(("revenue", "user1"), {"concept": "financial_performance"})
+    cache.set(("revenue", "user2"), {"concept": "financial_performance"})
+    cache.set(("attendance", "user1"), {"concept": "attendance"})
+    
+    cache.discard_where(lambda key: key[0] == "revenue")
+    
+    assert cache.get(("revenue", "user1")) is None
+    assert cache.get(("revenue", "user2")) is None
+    assert cache.get(("attendance", "user1")) == {"concept": "attendance"}
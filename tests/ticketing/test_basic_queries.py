@@ -6,7 +6,6 @@ Tests with real Cube.js data - NO MOCKS
 
 import pytest
 import asyncio
-from capabilities.ticketing_data import TicketingDataCapability
 from models.capabilities import TicketingDataInputs, CubeFilter
 
 
@@ -14,9 +13,9 @@ class TestTicketingDataCapability:
     """Test TicketingDataCapability with real data"""
     
     @pytest.fixture
-    async def capability(self):
-        """Create real capability instance"""
-        return TicketingDataCapability()
+    def capability(self, ticketing_capability):
+        """Session-wide capability instance (schema context built once)"""
+        return ticketing_capability
     
     @pytest.fixture
     async def tenant_id(self):
@@ -4,7 +4,6 @@ NO MOCKS - Real Cube.js integration tests only
 """
 import pytest
 import os
-from capabilities.ticketing_data import TicketingDataCapability
 from models.capabilities import TicketingDataInputs
 
 
@@ -13,9 +12,9 @@ class TestDrilldownFeatures:
     """Test hierarchical data exploration with real data"""
     
     @pytest.fixture
-    async def capability(self):
-        """Create real capability instance"""
-        return TicketingDataCapability()
+    def capability(self, ticketing_capability):
+        """Session-wide capability instance (schema context built once)"""
+        return ticketing_capability
     
     @pytest.fixture
     def tenant_id(self):
@@ -100,6 +99,5 @@ class TestDrilldownFeatures:
         # All results should be for Chicago (if LLM understood)
         # This is a soft assertion as it depends on LLM interpretation
         if result.data and 'productions.name' in result.data[0].dimensions:
-            names = [dp.dimensions.get('productions.name', '') for dp in result.data]
-            # At least check we got some production data
-            assert any(name for name in names)
\ No newline at end of file
+            # At least check we got some production data (stops at the first name)
+            assert any(dp.dimensions.get('productions.name') for dp in result.data)
\ No newline at end of file
@@ -4,7 +4,6 @@ NO MOCKS - Real Cube.js integration tests only
 """
 import pytest
 import os
-from capabilities.ticketing_data import TicketingDataCapability
 from models.capabilities import TicketingDataInputs, CubeFilter
 
 
@@ -13,9 +12,9 @@ class TestLLMUnderstanding:
     """Test LLM's ability to translate natural language to Cube.js queries"""
     
     @pytest.fixture
-    async def capability(self):
-        """Create real capability instance"""
-        return TicketingDataCapability()
+    def capability(self, ticketing_capability):
+        """Session-wide capability instance (schema context built once)"""
+        return ticketing_capability
     
     @pytest.fixture
     def tenant_id(self):
@@ -50,8 +49,9 @@ class TestLLMUnderstanding:
             ("past 7 days", "day")
         ]
         
-        for context, expected_granularity in time_contexts:
-            inputs = TicketingDataInputs(
+        # One batch: the requests are planned concurrently and sent to Cube.js together
+        results = await capability.execute_batch([
+            TicketingDataInputs(
                 session_id=f"test-time-{context.replace(' ', '-')}",
                 tenant_id=tenant_id,
                 user_id="test",
@@ -59,8 +59,10 @@ class TestLLMUnderstanding:
                 measures=["ticket_line_items.amount"],
                 time_context=context
             )
-            
-            result = await capability.execute(inputs)
+            for context, _ in time_contexts
+        ])
+        
+        for result in results:
             assert result.success
             
             # Check if time dimension was added
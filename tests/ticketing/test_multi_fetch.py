@@ -3,7 +3,6 @@ Test multi-fetch strategy for time comparisons
 """
 import pytest
 import os
-from capabilities.ticketing_data import TicketingDataCapability
 from models.capabilities import TicketingDataInputs
 
 
@@ -12,9 +11,9 @@ class TestMultiFetchStrategy:
     """Test multi-fetch for time comparisons and per-entity queries"""
     
     @pytest.fixture
-    async def capability(self):
-        """Create capability instance"""
-        return TicketingDataCapability()
+    def capability(self, ticketing_capability):
+        """Session-wide capability instance (schema context built once)"""
+        return ticketing_capability
     
     @pytest.fixture
     def tenant_id(self):
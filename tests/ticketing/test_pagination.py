@@ -4,7 +4,6 @@ NO MOCKS - Real Cube.js integration tests only
 """
 import pytest
 import os
-from capabilities.ticketing_data import TicketingDataCapability
 from models.capabilities import TicketingDataInputs
 
 
@@ -13,9 +12,9 @@ class TestPaginationFeatures:
     """Test pagination with real Cube.js data"""
     
     @pytest.fixture
-    async def capability(self):
-        """Create real capability instance"""
-        return TicketingDataCapability()
+    def capability(self, ticketing_capability):
+        """Session-wide capability instance (schema context built once)"""
+        return ticketing_capability
     
     @pytest.fixture
     def tenant_id(self):
@@ -5,14 +5,52 @@ Defines the orchestration graph with frame-based routing.
 Single-task execution with continuous replanning.
 """
 
-from typing import Dict, Any
+import asyncio
+import hashlib
+import os
+import sys
+import time
+from typing import Dict, Any, AsyncIterator, Awaitable, Callable, List, Optional
 from langgraph.graph import StateGraph, END
+from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.messages import AIMessage
+from diskcache import Cache
 
-from models.state import AgentState, CoreState
+from models.state import AgentState, CoreState, DebugState
 from workflow.nodes import WorkflowNodes
 
 
+class NodeTraceCallback(BaseCallbackHandler):
+    """Record the workflow nodes a run visits, in order"""
+    
+    # Appending a name is cheap; no need to hop to an executor thread
+    run_inline = True
+    
+    def __init__(self):
+        self.nodes: List[str] = []
+    
+    def on_chain_start(self, serialized, inputs, *, metadata=None, **kwargs) -> None:
+        # A node's own runnable starts under its node name
+        node = (metadata or {}).get("langgraph_node")
+        if node and kwargs.get("name") == node:
+            self.nodes.append(node)
+
+
+def _profiled(node: str, node_fn: Callable[[AgentState], Awaitable[AgentState]]):
+    """Wrap a node so debug runs record its latency in DebugState.node_profiles
+    
+    Shows whether a query is bound by Cube.js, the LLM calls or local work.
+    """
+    async def run(state: AgentState) -> AgentState:
+        start = time.perf_counter_ns()
+        result = await node_fn(state)
+        if result.debug:
+            result.debug.record_node_timing(node, time.perf_counter_ns() - start)
+        return result
+    
+    return run
+
+
 def create_workflow():
     """Create the LangGraph workflow"""
     
@@ -23,12 +61,12 @@ def create_workflow():
     workflow = StateGraph(AgentState)
     
     # Add nodes
-    workflow.add_node("extract_frames", nodes.extract_frames_node)
-    workflow.add_node("resolve_entities", nodes.resolve_entities_node)
-    workflow.add_node("orchestrate", nodes.orchestrate_node)
-    workflow.add_node("execute_chat", nodes.execute_chat_node)
-    workflow.add_node("execute_ticketing_data", nodes.execute_ticketing_data_node)
-    workflow.add_node("execute_event_analysis", nodes.execute_event_analysis_node)
+    workflow.add_node("extract_frames", _profiled("extract_frames", nodes.extract_frames_node))
+    workflow.add_node("resolve_entities", _profiled("resolve_entities", nodes.resolve_entities_node))
+    workflow.add_node("orchestrate", _profiled("orchestrate", nodes.orchestrate_node))
+    workflow.add_node("execute_chat", _profiled("execute_chat", nodes.execute_chat_node))
+    workflow.add_node("execute_ticketing_data", _profiled("execute_ticketing_data", nodes.execute_ticketing_data_node))
+    workflow.add_node("execute_event_analysis", _profiled("execute_event_analysis", nodes.execute_event_analysis_node))
     
     # Define routing function
     def route_by_next_node(state: AgentState) -> str:
@@ -56,56 +94,230 @@ def create_workflow():
     return workflow.compile()
 
 
-async def process_query(
+# Compiled workflow reused across queries; services it owns (asyncpg pool,
+# HTTP clients) are bound to the event loop they were created on
+_workflow = None
+_workflow_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_workflow():
+    """Get the shared compiled workflow, building it once per event loop"""
+    global _workflow, _workflow_loop
+    
+    loop = asyncio.get_running_loop()
+    if _workflow is None or _workflow_loop is not loop:
+        _workflow = create_workflow()
+        _workflow_loop = loop
+    return _workflow
+
+
+STREAM_BUFFER_SIZE = 8
+
+
+async def _buffered(source: AsyncIterator[Any], maxsize: int = STREAM_BUFFER_SIZE) -> AsyncIterator[Any]:
+    """Drain an async iterator from a background task through a bounded queue
+    
+    The producer runs up to maxsize items ahead of the consumer. Errors are
+    re-raised to the consumer, and closing the consumer cancels the producer.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+    
+    async def produce() -> None:
+        try:
+            async for item in source:
+                await queue.put((False, item))
+        except Exception as e:
+            await queue.put((True, e))
+        else:
+            await queue.put((True, None))
+    
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            finished, item = await queue.get()
+            if finished:
+                if item is not None:
+                    raise item
+                return
+            yield item
+    finally:
+        producer.cancel()
+
+
+def _build_initial_state(
     query: str,
     session_id: str,
     user_id: str,
     tenant_id: str,
     debug: bool = False
-) -> Dict[str, Any]:
-    """Process a user query through the workflow"""
+) -> AgentState:
+    """Build the initial workflow state for a user query"""
     
-    # Create initial state
+    # Create initial state, with debug tracing set up front if requested
     initial_state = AgentState(
         core=CoreState(
             session_id=session_id,
             user_id=user_id,
             tenant_id=tenant_id,
             query=query
-        )
+        ),
+        debug=DebugState(trace_enabled=True) if debug else None
     )
     
     # Add user message
     initial_state.add_message("user", query)
     
-    # Enable debug if requested
-    if debug:
-        from models.state import DebugState
-        initial_state.debug = DebugState(trace_enabled=True)
+    return initial_state
+
+
+async def astream_query(
+    query: str,
+    session_id: str,
+    user_id: str,
+    tenant_id: str,
+    debug: bool = False
+) -> AsyncIterator[Any]:
+    """Process a user query, yielding each workflow step as soon as its node finishes
     
-    # Create and run workflow
-    workflow = create_workflow()
+    Lets callers surface progress (frames extracted, entities resolved, data
+    fetched) instead of waiting for the whole run.
+    """
     
-    # Run with streaming to see progress
-    final_state = None
-    async for state in workflow.astream(initial_state):
-        final_state = state
-        
-        # Could emit progress events here
-        if debug:
-            print(f"Node: {state.get('core', {}).get('current_node', 'unknown')}")
+    initial_state = _build_initial_state(query, session_id, user_id, tenant_id, debug)
+    
+    # Run the shared workflow ahead of the caller, so slow handling of one step
+    # (rendering, printing) does not hold up the next node
+    workflow = get_workflow()
+    
+    async for state in _buffered(workflow.astream(initial_state)):
+        yield state
+
+
+async def astream_query_events(
+    query: str,
+    session_id: str,
+    user_id: str,
+    tenant_id: str,
+    debug: bool = False
+) -> AsyncIterator[Dict[str, Any]]:
+    """Process a user query, yielding LLM tokens and node completions from one run
+    
+    Yields {"type": "token", "node", "content"} for each streamed LLM chunk and
+    {"type": "node", "node"} when a workflow node finishes, so callers can render
+    text as it is generated without running the graph a second time.
+    """
+    
+    initial_state = _build_initial_state(query, session_id, user_id, tenant_id, debug)
+    workflow = get_workflow()
+    
+    async for event in workflow.astream_events(initial_state, version="v2"):
+        # Most events are neither kind, so dispatch before touching metadata
+        kind = event["event"]
+        if kind == "on_chat_model_stream":
+            content = event["data"]["chunk"].content
+            if content:
+                yield {"type": "token", "node": event["metadata"].get("langgraph_node"), "content": content}
+        elif kind == "on_chain_end":
+            node = event["metadata"].get("langgraph_node")
+            if event["name"] == node:
+                # A node's own runnable ends under its node name
+                yield {"type": "node", "node": node}
+
+
+# Opt-in cache of completed responses, for repeated questions in tests and demos
+RESPONSE_CACHE_TTL_SECONDS = 60 * 60
+_response_cache: Optional[Cache] = None
+
+
+def _get_response_cache() -> Cache:
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = Cache(os.getenv("RESPONSE_CACHE_DIR", "./response_cache"))
+    return _response_cache
+
+
+def _response_cache_key(query: str, user_id: str, tenant_id: str) -> str:
+    """Key on tenant, user and whitespace/case-normalized query text"""
+    normalized_query = " ".join(query.lower().split())
+    raw = "\x00".join([tenant_id, user_id, normalized_query]).encode()
+    return hashlib.blake2b(raw, digest_size=32).hexdigest()
+
+
+async def process_query(
+    query: str,
+    session_id: str,
+    user_id: str,
+    tenant_id: str,
+    debug: bool = False,
+    use_cache: bool = False
+) -> Dict[str, Any]:
+    """Process a user query through the workflow
+    
+    With use_cache, a successful response for the same tenant, user and
+    normalized query is returned from disk for an hour. Debug runs are never cached.
+    """
+    
+    use_cache = use_cache and not debug
+    if use_cache:
+        cache_key = _response_cache_key(query, user_id, tenant_id)
+        # diskcache I/O and unpickling run off the loop so concurrent queries aren't stalled
+        cached = await asyncio.to_thread(_get_response_cache().get, cache_key)
+        if cached is not None:
+            return cached
+    
+    initial_state = _build_initial_state(query, session_id, user_id, tenant_id, debug)
+    
+    if debug:
+        # One run: the callback records node visits, and the trace is written
+        # once at the end instead of once per step
+        node_trace = NodeTraceCallback()
+        final_state = await get_workflow().ainvoke(initial_state, config={"callbacks": [node_trace]})
+        sys.stdout.write("".join(f"Node: {node}\n" for node in node_trace.nodes))
+    else:
+        final_state = await get_workflow().ainvoke(initial_state)
     
     # Extract response
     if final_state and hasattr(final_state, 'core'):
-        return {
+        result = {
             "success": final_state.core.status == "complete",
             "response": final_state.core.final_response,
             "messages": [msg.model_dump() for msg in final_state.core.messages],
+            "errors": final_state.core.error_messages,
             "debug": final_state.debug.model_dump() if final_state.debug else None
         }
+        if use_cache and result["success"]:
+            await asyncio.to_thread(_get_response_cache().set, cache_key, result, expire=RESPONSE_CACHE_TTL_SECONDS)
+        return result
     else:
         return {
             "success": False,
             "error": "Workflow failed to complete",
             "response": None
-        }
\ No newline at end of file
+        }
+
+
+async def process_queries(
+    queries: List[str],
+    session_id: str,
+    user_id: str,
+    tenant_id: str,
+    debug: bool = False,
+    use_cache: bool = False
+) -> List[Dict[str, Any]]:
+    """Process independent queries concurrently on the shared workflow
+    
+    Each query gets its own session ("<session_id>-<n>") so their memories
+    don't mix; their LLM and Cube.js calls overlap on the pooled clients.
+    Results come back in query order.
+    """
+    return await asyncio.gather(*(
+        process_query(
+            query=query,
+            session_id=f"{session_id}-{index}",
+            user_id=user_id,
+            tenant_id=tenant_id,
+            debug=debug,
+            use_cache=use_cache
+        )
+        for index, query in enumerate(queries, start=1)
+    ))